@@ -1,21 +1,35 @@
 # audio_manager.py
 # A dedicated controller for managing all game audio, including music and sound effects.
 
-# Replace the entire contents of audio_manager.py with this new code.
-
 import pygame
 import os
 import random
+from concurrent.futures import ThreadPoolExecutor
 
 DEBUG = True
+_SFX_EXT = frozenset(("wav", "ogg"))
+_FILTER_CACHE_SIZE = 32     # Distinct SFX filters remembered before the oldest is dropped
+_SFX_CHANNEL_STEP = 8       # Channels added each time every SFX channel is busy
+_MAX_SFX_CHANNELS = 64      # Pool ceiling; once reached, the oldest SFX channel is reused
+
+def _filter_key(names):
+    """Returns a hashable cache key for an SFX filter, reusing tuples and frozensets as-is."""
+    if not names:
+        return None
+    if isinstance(names, (tuple, frozenset)):
+        return names
+    return tuple(names)
 
 class AudioManager:
     """Handles loading and playback of music and a directory of sound effects."""
-    def __init__(self):
+    def __init__(self, buffer_size=512):
         try:
-            pygame.mixer.pre_init(44100, -16, 2, 2048)
+            # 🎚️ A 512-sample buffer keeps SFX latency around 12 ms at 44.1 kHz, at the
+            # cost of waking the mixer thread more often. Raise it if playback stutters.
+            pygame.mixer.pre_init(44100, -16, 2, buffer_size)
             pygame.mixer.init()
-            pygame.mixer.set_num_channels(16) 
+            pygame.mixer.set_num_channels(32)
+            # 🎵 Channel 0 is the music channel; _find_sfx_channel only ever picks from 1 upward.
             self.music_channel = pygame.mixer.Channel(0)
             print("[AudioManager] ✅ Mixer initialized successfully.")
         except pygame.error as e:
@@ -23,9 +37,30 @@ class AudioManager:
             self.music_channel = None
 
         self.music_volume = 0.5
-        self.sfx_volume = 0.7
         self.current_music = None
         self.sfx_cache = {}
+        self.music_cache = {}
+        self.sfx_volume = 0.7
+
+        # 🗂️ Cached views of the SFX keys, rebuilt only when the cache changes.
+        self._sfx_keys_tuple = ()
+        self._filter_cache = {}
+
+        # ⏱️ When each SFX channel last started a sound (channel index -> play count), for stealing the oldest
+        self._sfx_started = {}
+        self._sfx_play_count = 0
+
+    @property
+    def sfx_volume(self):
+        """The volume applied to every cached sound effect."""
+        return self._sfx_volume
+
+    @sfx_volume.setter
+    def sfx_volume(self, value):
+        # 🔊 Apply the new volume to each cached sound once, not on every play.
+        self._sfx_volume = value
+        for sound in self.sfx_cache.values():
+            sound.set_volume(value)
 
     def load_sfx_directory(self, directory_path):
         """Loads all .wav and .ogg files from a directory into the SFX cache."""
@@ -33,47 +68,101 @@ class AudioManager:
             if DEBUG: print(f"[AudioManager] ❌ SFX directory not found: {directory_path}")
             return
 
-        for filename in os.listdir(directory_path):
-            if filename.endswith((".wav", ".ogg")):
-                full_path = os.path.join(directory_path, filename)
+        # 🧵 Decode the files in parallel; SDL_mixer releases the GIL while decoding.
+        loaded_sfx = {}
+        with ThreadPoolExecutor(max_workers=8) as executor, os.scandir(directory_path) as entries:
+            futures = {
+                entry.name: executor.submit(pygame.mixer.Sound, entry.path)
+                for entry in entries
+                if entry.name.rpartition(".")[2] in _SFX_EXT
+            }
+            for filename, future in futures.items():
                 try:
                     # The filename itself is used as the key.
-                    self.sfx_cache[filename] = pygame.mixer.Sound(full_path)
+                    sound = future.result()
+                    sound.set_volume(self._sfx_volume)
+                    loaded_sfx[filename] = sound
                 except pygame.error as e:
                     if DEBUG: print(f"[AudioManager] ❌ Failed to load SFX '{filename}': {e}")
+        self.sfx_cache.update(loaded_sfx)
+
+        # 🗂️ Refresh the cached key tuple and drop any stale filter results.
+        self._sfx_keys_tuple = tuple(self.sfx_cache)
+        self._filter_cache.clear()
         
         print(f"[AudioManager] ✅ Loaded {len(self.sfx_cache)} sound effects from '{directory_path}'.")
 
     def play_sfx(self, whitelist=None, blacklist=None):
         """
         Plays a random SFX, optionally filtered by a whitelist or blacklist of filenames.
+        Pass the filters as tuples (ideally module-level constants) so they can key the
+        filter cache directly; lists are copied to a tuple on every call.
         """
-        # 🎛️ Start with a list of all available sound filenames.
-        candidate_sfx = list(self.sfx_cache.keys())
-        if not candidate_sfx:
+        # 🎛️ Start with the cached tuple of all available sound filenames.
+        if not self._sfx_keys_tuple:
             if DEBUG: print("[AudioManager] ⚠️ No sound effects loaded to play.")
             return
 
-        # ✅ Apply whitelist if one is provided.
-        if whitelist:
-            candidate_sfx = [sfx for sfx in candidate_sfx if sfx in whitelist]
-        # ❌ Apply blacklist if no whitelist was provided.
-        elif blacklist:
-            candidate_sfx = [sfx for sfx in candidate_sfx if sfx not in blacklist]
+        # 🗂️ Look up the filtered candidates, building them only once per filter.
+        filter_key = (_filter_key(whitelist), _filter_key(blacklist))
+        candidate_sfx = self._filter_cache.get(filter_key)
+        if candidate_sfx is None:
+            # ✅ Apply whitelist if one is provided.
+            if whitelist:
+                whitelist_set = frozenset(whitelist)
+                candidate_sfx = tuple(sfx for sfx in self._sfx_keys_tuple if sfx in whitelist_set)
+            # ❌ Apply blacklist if no whitelist was provided.
+            elif blacklist:
+                blacklist_set = frozenset(blacklist)
+                candidate_sfx = tuple(sfx for sfx in self._sfx_keys_tuple if sfx not in blacklist_set)
+            else:
+                candidate_sfx = self._sfx_keys_tuple
+
+            # 🧹 Keep the cache bounded; dicts keep insertion order, so the first key is the oldest.
+            if len(self._filter_cache) >= _FILTER_CACHE_SIZE:
+                del self._filter_cache[next(iter(self._filter_cache))]
+            self._filter_cache[filter_key] = candidate_sfx
 
         # 🔊 Check if any sounds matched the criteria.
         if not candidate_sfx:
             if DEBUG: print("[AudioManager] ⚠️ No sound effects matched the filter criteria.")
             return
 
-        # 🎲 Select a random sound from the filtered list.
+        # 🎲 Select a random sound from the filtered tuple.
         chosen_sfx_key = random.choice(candidate_sfx)
         sound = self.sfx_cache[chosen_sfx_key]
-        sound.set_volume(self.sfx_volume)
-        sound.play()
+        channel_index = self._find_sfx_channel()
+        if channel_index is None:
+            if DEBUG: print(f"[AudioManager] ⚠️ No free channel for SFX: {chosen_sfx_key}")
+            return
+        pygame.mixer.Channel(channel_index).play(sound)
+        self._sfx_play_count += 1
+        self._sfx_started[channel_index] = self._sfx_play_count
 
         # 📢 Print the chosen filename to the console for easy debugging.
-        print(f"[Audio] ▶️ Played SFX: {chosen_sfx_key}")
+        if DEBUG: print(f"[Audio] ▶️ Played SFX: {chosen_sfx_key}")
+
+    def _find_sfx_channel(self):
+        """
+        Returns the index of a channel for an SFX, never the music channel (0). Picks an idle
+        channel, grows the pool up to _MAX_SFX_CHANNELS when all are busy, and only then
+        steals the SFX channel that started playing earliest.
+        """
+        # pygame's find_channel() can't exclude channel 0, so the SFX channels are scanned here.
+        num_channels = pygame.mixer.get_num_channels()
+        for index in range(1, num_channels):
+            if not pygame.mixer.Channel(index).get_busy():
+                return index
+
+        if num_channels < _MAX_SFX_CHANNELS:
+            # 📈 Every SFX channel is busy; add a few more (up to the ceiling) and use the first new one.
+            pygame.mixer.set_num_channels(min(num_channels + _SFX_CHANNEL_STEP, _MAX_SFX_CHANNELS))
+            return max(num_channels, 1)
+
+        # ♻️ At the ceiling: take over the SFX channel whose sound started the longest ago.
+        if num_channels < 2:
+            return None
+        return min(range(1, num_channels), key=lambda index: self._sfx_started.get(index, 0))
 
     def play_music(self, filepath, loops=-1):
         """Loads and plays looping background music on its dedicated channel."""
@@ -86,10 +175,36 @@ class AudioManager:
             
         try:
             self.music_channel.stop()
-            music_sound = pygame.mixer.Sound(filepath)
+            # 💾 Reuse an already-decoded track if we've loaded it before.
+            music_sound = self.music_cache.get(filepath)
+            if music_sound is None:
+                music_sound = pygame.mixer.Sound(filepath)
+                self.music_cache[filepath] = music_sound
             self.current_music = music_sound
             self.music_channel.set_volume(self.music_volume)
             self.music_channel.play(self.current_music, loops=loops)
-            print(f"[AudioManager] ✅ Now playing: {filepath}")
+            if DEBUG: print(f"[AudioManager] ✅ Now playing: {filepath}")
         except pygame.error as e:
-            if DEBUG: print(f"[AudioManager] ❌ Failed to play music: {e}")
\ No newline at end of file
+            if DEBUG: print(f"[AudioManager] ❌ Failed to play music: {e}")
+
+    def preload_music(self, filepaths):
+        """Decodes a list of music files into the music cache ahead of time."""
+        for filepath in filepaths:
+            if filepath in self.music_cache:
+                continue
+            if not os.path.exists(filepath):
+                if DEBUG: print(f"[AudioManager] ❌ Music file not found: {filepath}")
+                continue
+            try:
+                self.music_cache[filepath] = pygame.mixer.Sound(filepath)
+            except pygame.error as e:
+                if DEBUG: print(f"[AudioManager] ❌ Failed to preload music '{filepath}': {e}")
+
+        if DEBUG: print(f"[AudioManager] ✅ Music cache holds {len(self.music_cache)} tracks.")
+
+    def clear_music_cache(self):
+        """Releases all cached music tracks except the one currently playing."""
+        self.music_cache = {
+            path: sound for path, sound in self.music_cache.items()
+            if sound is self.current_music
+        }
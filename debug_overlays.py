@@ -1,9 +1,9 @@
 # debug_overlays.py
 # Functions for adding visual debugging information to the notebook.
 
-from shared_helpers import hex_geometry
+from shared_helpers import hex_to_pixel
 import random
-from scenes.loading_screen.generate_terrain import REGIONAL_TAG_PRIORITY
+from scenes.loading_screen.generate_terrain import REGIONAL_TAG_PRIORITY, TAG_BITS, rule_masks
 
 # ──────────────────────────────────────────────────
 # ⚙️ Debug Toggles
@@ -17,9 +17,23 @@ SHOW_SPINE          = False     # Draws the continent spine used for elevation.
 SHOW_RIVER_PATHS    = False     # Draws a series of dots along each river path.
 SHOW_RIVER_ENDPOINTS = False    # Draws a special circle on river sources and destinations.
 
+# Names of the active overlays, computed once so the assembler is free when every overlay is switched off.
+_ENABLED = frozenset(name for name, on in (
+    ("centers",         SHOW_HEX_CENTERS),
+    ("coordinates",     SHOW_COORDINATES),
+    ("region_borders",  SHOW_REGION_BORDERS),
+    ("terrain_tags",    SHOW_TERRAIN_TAGS),
+    ("spine",           SHOW_SPINE),
+    ("river_paths",     SHOW_RIVER_PATHS),
+    ("river_endpoints", SHOW_RIVER_ENDPOINTS),
+) if on)
+
 SPINE_TRIM_MODE = 'NONE' # Can be 'PERCENT', 'ABSOLUTE', or 'NONE'
 SPINE_TRIM_VALUE = 3       # The value to use for trimming (e.g., 20% or 4 tiles)
 
+# Shifts signed coordinates into unsigned 16-bit range for int-packed edge keys.
+EDGE_KEY_COORD_OFFSET = 32768
+
 # ──────────────────────────────────────────────────
 # 🎨 Config & Constants
 # ──────────────────────────────────────────────────
@@ -44,6 +58,60 @@ OVERLAY_COLORS = {
     "river_termination":  (220, 20, 60),    # Crimson Red
     }
 
+# Regional rules paired with their tag bitmasks, keyed by the rule's color tag.
+RULE_MASKS = [(rule[0], mask) for rule, mask in rule_masks(REGIONAL_TAG_PRIORITY)]
+
+# Shared fields of the translucent tag circles drawn by the spine and terrain tag overlays.
+_TAG_CIRCLE_TEMPLATE = {"type": "circle", "base_radius": 50, "opacity": 128}
+
+# Overlay color for each rule, aligned with RULE_MASKS (None when a rule has no color).
+_RULE_COLORS = [OVERLAY_COLORS.get(rule[0]) for rule in REGIONAL_TAG_PRIORITY]
+
+# ──────────────────────────────────────────────────
+# 🧰 Helpers
+# ──────────────────────────────────────────────────
+
+def _z_by_row(z_formula, coords):
+    """Evaluates a z-formula once per distinct row instead of once per tile."""
+    return {r: z_formula(r) for r in {r for _, r in coords}}
+
+def _river_overlay_seed(river_paths):
+    """Folds every river coordinate into a 32-bit seed that is stable for a given map."""
+    seed = len(river_paths)
+    for path in river_paths:
+        for q, r in path:
+            seed = (seed * 31 + q * 65537 + r) & 0xFFFFFFFF
+    return seed
+
+def _build_edge_specs(persistent_state, variable_state):
+    """
+    Returns, for even (0) and odd (1) rows, a list of
+    (edge_name, p1_offset, p2_offset, neighbor_offset) per hex edge.
+    """
+    anatomy = persistent_state["pers_hex_anatomy"]
+    oddr = persistent_state["pers_neighbor_offsets"]["oddr"]
+    edge_to_neighbor = persistent_state["pers_edge_to_neighbor"]
+    zoom = variable_state.get("var_current_zoom", 1.0)
+    half_w = (persistent_state["pers_tile_hex_w"] * zoom) / 2
+    half_h = (persistent_state["pers_tile_hex_h"] * zoom) / 2
+
+    # Corner positions relative to the hex center, matching hex_geometry
+    corner_offsets = {
+        idx: (info["vector"][0] * half_w, info["vector"][1] * half_h)
+        for idx, info in anatomy["corners"].items()
+    }
+
+    return [
+        [
+            (info["name"],
+             corner_offsets[info["corner_pair"][0]],
+             corner_offsets[info["corner_pair"][1]],
+             oddr[parity][edge_to_neighbor[info["name"]]])
+            for info in anatomy["edges"].values()
+        ]
+        for parity in ("even", "odd")
+    ]
+
 # ──────────────────────────────────────────────────
 # 📷 Individual Overlay Functions
 # ──────────────────────────────────────────────────
@@ -66,6 +134,7 @@ def add_spine_overlay(tile_objects, notebook, persistent_state):
 
     # Iterate through all tiles and add an overlay to those with spine data
     land_coords = persistent_state.get("pers_quick_tile_lookup", [])
+    z_by_row = _z_by_row(z_formula, land_coords)
     for q, r in land_coords:
         tile = tile_objects.get((q, r))
         if tile and hasattr(tile, "spine_data"):
@@ -93,14 +162,13 @@ def add_spine_overlay(tile_objects, notebook, persistent_state):
             if not is_visible:
                 continue
 
-            # Calculate the z-order for the overlay
-            overlay_z = z_formula(r)
+            # Look up the z-order for the overlay
+            overlay_z = z_by_row[r]
 
             # Add the circle overlay to the notebook
-            notebook[f"overlay_spine_{q}_{r}"] = {
-                "type": "circle", "coord": (q, r), "z": overlay_z,
-                "color": color, "base_radius": 50, "opacity": 128, "tag": "spine",
-            }
+            entry = _TAG_CIRCLE_TEMPLATE.copy()
+            entry.update(coord=(q, r), z=overlay_z, color=color, tag="spine")
+            notebook[("overlay_spine", q, r)] = entry
 
 def add_hex_center_overlay(tile_objects, notebook, persistent_state):
     """Draws a black circle at the mathematical center of every hex."""
@@ -111,20 +179,17 @@ def add_hex_center_overlay(tile_objects, notebook, persistent_state):
         print("⚠️ Debug icon z-formula not found in persistent_state.")
         return
 
-    # Iterate through all tiles
-    for (q, r), tile in tile_objects.items():
-        # Calculate the z-order for the overlay
-        overlay_z = z_formula(r)
-
-        # Create a unique key for the overlay
-        key = f"dbg_center_{q}_{r}"
-
-        # Add the circle overlay to the notebook
-        notebook[key] = {
+    # Build a circle overlay for every tile and add them to the notebook in one go
+    z_by_row = _z_by_row(z_formula, tile_objects)
+    color = OVERLAY_COLORS["hex_center"]
+    notebook.update({
+        ("dbg_center", q, r): {
             "type": "circle", "coord": (q, r),
-            "z": overlay_z,
-            "color": OVERLAY_COLORS["hex_center"], "base_radius": 30,
+            "z": z_by_row[r],
+            "color": color, "base_radius": 30,
         }
+        for q, r in tile_objects
+    })
 
 def add_qr_coordinates_overlay(tile_objects, notebook, persistent_state):
     """Draws the (q,r) coordinate as text on each tile."""
@@ -138,33 +203,41 @@ def add_qr_coordinates_overlay(tile_objects, notebook, persistent_state):
         print("⚠️ Coordinate z-formula not found in persistent_state.")
         return
 
-    # Iterate through all tiles
-    for (q, r), tile in tile_objects.items():
-
-        # Calculate the z-order for the text overlay
-        overlay_z = z_formula(r)
-
-        # Add the text overlay to the notebook
-        notebook[f"coord_{q}_{r}"] = {
+    # Build a text overlay for every tile and add them to the notebook in one go
+    z_by_row = _z_by_row(z_formula, tile_objects)
+    notebook.update({
+        ("coord", q, r): {
             "type": "text",
             "coord": (q, r),
-            "z": overlay_z,
+            "z": z_by_row[r],
             "text": f"{q},{r}",
             "color": (0, 0, 0),
             "base_size": 48,
         }
+        for q, r in tile_objects
+    })
 
 def add_region_border_overlay(tile_objects, notebook, persistent_state, variable_state):
     """Draws thick black lines between different regions."""
 
-    # Initialize sets to track which edges and vertices have been drawn
+    # Track which edges have been drawn, and each unique vertex keyed by its
+    # rounded pixel position so float noise can't create duplicates
     drawn_edges = set()
-    border_vertices = set()
+    border_vertices = {}
 
     # Define line thickness and z-order
     line_thickness = 20
     z_formulas = persistent_state.get("pers_z_formulas", {})
     z_border = z_formulas.get("region_border", lambda r: 1.5)(0) # Pass a dummy 'r'
+
+    # The edge endpoints relative to a hex center and the neighbor offsets only
+    # depend on row parity, so build them once and translate per tile.
+    edge_specs = _build_edge_specs(persistent_state, variable_state)
+
+    # Resolve every tile's region once so each edge test is a single lookup.
+    # Tiles without a region map to None; missing tiles fall back to the sentinel.
+    region_by_coord = {coord: getattr(t, 'region_id', None) for coord, t in tile_objects.items()}
+    no_tile = object()
     
     # Iterate through each tile to find region borders
     land_coords = persistent_state.get("pers_quick_tile_lookup", [])
@@ -172,23 +245,26 @@ def add_region_border_overlay(tile_objects, notebook, persistent_state, variable
         tile = tile_objects.get((q, r))
         if not tile or not hasattr(tile, "region_id"): continue
 
-        # Get the geometry for the current tile
-        geo = hex_geometry(q, r, persistent_state, variable_state)
+        # Get the pixel center for the current tile
+        cx, cy = hex_to_pixel(q, r, persistent_state, variable_state)
         this_region = tile.region_id
 
+        # This tile's half of every packed edge key
+        a = ((q + EDGE_KEY_COORD_OFFSET) << 16) | (r + EDGE_KEY_COORD_OFFSET)
+
         # Loop through each of the tile's edges
-        for idx, (p1, p2) in geo["edges"].items():
-            edge_name = persistent_state["pers_hex_anatomy"]["edges"][idx]["name"]
+        for edge_name, (ax, ay), (bx, by), (dq, dr) in edge_specs[r & 1]:
             
             # Get the coordinates of the neighbor on the other side of the edge
-            nq, nr = geo["neighbors"][edge_name]
-            neighbor = tile_objects.get((nq, nr))
+            nq, nr = q + dq, r + dr
 
             # Check if the neighbor exists and is in a different region
-            if not neighbor or getattr(neighbor, 'region_id', None) != this_region:
+            if region_by_coord.get((nq, nr), no_tile) != this_region:
 
-                # Create a consistent key for the edge regardless of direction
-                edge_key = tuple(sorted(((q, r), (nq, nr))))
+                # Create a consistent key for the edge regardless of direction by
+                # packing each coord into one int and ordering the pair.
+                b = ((nq + EDGE_KEY_COORD_OFFSET) << 16) | (nr + EDGE_KEY_COORD_OFFSET)
+                edge_key = (a << 32) | b if a < b else (b << 32) | a
 
                 # Only draw the edge if it hasn't been drawn yet
                 if edge_key in drawn_edges: continue
@@ -197,22 +273,24 @@ def add_region_border_overlay(tile_objects, notebook, persistent_state, variable
                 drawn_edges.add(edge_key)
 
                 # Add the line overlay to the notebook
-                key = f"region_edge_{q}_{r}_{edge_name}"
+                p1 = (cx + ax, cy + ay)
+                p2 = (cx + bx, cy + by)
+                key = ("region_edge", q, r, edge_name)
                 notebook[key] = {
                     "type": "edge_line", "p1": p1, "p2": p2,
                     "z": z_border, 
                     "color": (0, 0, 0), "thickness": line_thickness,
                 }
                 
-                # Add the vertices of the border line to a set
-                border_vertices.add(p1)
-                border_vertices.add(p2)
+                # Add the vertices of the border line, keeping the first of each
+                border_vertices.setdefault((int(p1[0]), int(p1[1])), p1)
+                border_vertices.setdefault((int(p2[0]), int(p2[1])), p2)
 
     # Draw a circle on each unique border vertex
-    for i, vertex in enumerate(border_vertices):
+    for (vx, vy), vertex in border_vertices.items():
 
         # Add a small circle to the notebook for each border vertex
-        notebook[f"border_vertex_{i}"] = {
+        notebook[("border_vertex", vx, vy)] = {
             "type": "circle",
             "pixel_coord": vertex,
             "z": z_border + 0.01, 
@@ -235,30 +313,29 @@ def add_terrain_tag_overlay(tile_objects, notebook, persistent_state):
     
     # Iterate through all tiles
     land_coords = persistent_state.get("pers_quick_tile_lookup", [])
+    z_by_row = _z_by_row(z_formula, land_coords)
     for q, r in land_coords:
         tile = tile_objects.get((q, r))
         if not tile: continue
 
+        # Pack the tile's tags once so each rule is a single AND
+        tile_mask = sum(bit for tag, bit in TAG_BITS.items() if getattr(tile, tag, False))
+
         # Loop through the terrain tag priority rules
-        for rule in REGIONAL_TAG_PRIORITY:
+        for (color_key, rule_mask), color in zip(RULE_MASKS, _RULE_COLORS):
 
             # Check if all tags in the current rule are present on the tile
-            if all(getattr(tile, tag, False) for tag in rule):
-
-                # Use the first tag in the rule as the color key
-                color_key = rule[0]
-                color = OVERLAY_COLORS.get(color_key)
+            if (tile_mask & rule_mask) == rule_mask:
 
                 # Skip to the next rule if no color is found
                 if not color:
                     break 
 
                 # Add the circle overlay to the notebook
-                overlay_z = z_formula(r)
-                notebook[f"overlay_{color_key}_{q}_{r}"] = {
-                    "type": "circle", "coord": (q, r), "z": overlay_z,
-                    "color": color, "base_radius": 50, "opacity": 128, "tag": color_key,
-                }
+                overlay_z = z_by_row[r]
+                entry = _TAG_CIRCLE_TEMPLATE.copy()
+                entry.update(coord=(q, r), z=overlay_z, color=color, tag=color_key)
+                notebook[("overlay", color_key, q, r)] = entry
 
                 # Break the inner loop once a matching rule is found
                 break
@@ -284,48 +361,48 @@ def add_river_path_overlay(river_paths, notebook, persistent_state):
     max_radius = 60
     min_radius = 10
 
+    # Collect every dot locally and add them to the notebook in one bulk update
+    river_dots = {}
+    z_by_row = _z_by_row(z_formula, (coord for path in river_paths for coord in path))
+
+    # Draw every path's size offset (+/- 15%) and color up front from a private generator
+    # seeded by this map's rivers, so styles vary between maps but stay stable for one map
+    rng = random.Random(_river_overlay_seed(river_paths))
+    path_styles = [
+        (1.0 + rng.uniform(-0.15, 0.15), (rng.randint(50, 255), rng.randint(50, 255), rng.randint(50, 255)))
+        for _ in river_paths
+    ]
+
     # Loop through each river path
-    for i, path in enumerate(river_paths):
+    for i, (path, (size_offset_factor, color)) in enumerate(zip(river_paths, path_styles)):
         path_len = len(path)
         if path_len <= 1: continue
 
-        # Create a unique, random size offset for this entire river path
-        size_offset_factor = 1.0 + random.uniform(-0.15, 0.15) # +/- 15%
-
-        # Assign a random color to the entire river path
-        color = (random.randint(50, 255), random.randint(50, 255), random.randint(50, 255))
+        # The radius shrinks linearly from max_radius at the source to min_radius plus 20%
+        # of the range at the mouth, so scale the start and per-dot step once per path.
+        start_radius = max_radius * size_offset_factor
+        radius_step = (max_radius - min_radius) * 0.8 * size_offset_factor / (path_len - 1)
 
         # Loop through each coordinate in the river path
-        for j, coord in enumerate(path):
-            q, r = coord
-            
-            # Normalize the tile's position along the path from 0.0 to 1.0
-            normalized_pos = j / (path_len - 1)
-
-            # Create a scale factor to make the dots at the source larger
-            scale_factor = 1.0 - normalized_pos
-
-            # Clamp the scale factor to a minimum value
-            clamped_scale = 0.2 + (scale_factor * 0.8)
-
-            # Calculate the base radius for the current dot
-            base_radius = min_radius + (max_radius - min_radius) * clamped_scale
+        for j, (q, r) in enumerate(path):
             
-            # Apply the random offset to the final radius
-            final_radius = int(base_radius * size_offset_factor)
+            # Larger dots at the source, shrinking toward the termination
+            final_radius = int(start_radius - j * radius_step)
 
             # Adjust the z-value based on radius to ensure larger dots draw first
             # A larger radius results in a smaller z-offset, pushing it further back.
             z_offset_for_size = (max_radius - final_radius) * 0.000001
-            overlay_z = z_formula(r) + z_offset_for_size
+            overlay_z = z_by_row[r] + z_offset_for_size
             
             # Add the river path dot to the notebook
-            unique_key = f"overlay_river_{i}_{j}_{q}_{r}"
-            notebook[unique_key] = {
+            unique_key = ("overlay_river", i, j)
+            river_dots[unique_key] = {
                 "type": "circle", "coord": (q, r), "z": overlay_z,
                 "color": color, "base_radius": final_radius, "opacity": 200
             }
 
+    notebook.update(river_dots)
+
 def add_river_endpoints_overlay(river_paths, notebook, persistent_state):
     """
     Draws a hollow circle on the source and termination tile of each river.
@@ -348,6 +425,7 @@ def add_river_endpoints_overlay(river_paths, notebook, persistent_state):
     term_color = OVERLAY_COLORS["river_termination"]
     radius = 70 
     outline_width = 15 # The base thickness of the circle's outline
+    z_by_row = _z_by_row(z_formula, (coord for path in river_paths if path for coord in (path[0], path[-1])))
 
     # Loop through each river path
     for path in river_paths:
@@ -358,18 +436,18 @@ def add_river_endpoints_overlay(river_paths, notebook, persistent_state):
         term_q, term_r = path[-1]
 
         # Add a circle for the river source
-        notebook[f"overlay_river_source_{source_q}_{source_r}"] = {
+        notebook[("overlay_river_source", source_q, source_r)] = {
             "type": "circle", "coord": (source_q, source_r),
-            "z": z_formula(source_r) + 0.0001,
+            "z": z_by_row[source_r] + 0.0001,
             "color": source_color, "base_radius": radius, "opacity": 255,
             "width": outline_width 
         }
 
         # Add a circle for the river termination, but only if it's not the same tile as the source
         if (source_q, source_r) != (term_q, term_r):
-             notebook[f"overlay_river_term_{term_q}_{term_r}"] = {
+             notebook[("overlay_river_term", term_q, term_r)] = {
                 "type": "circle", "coord": (term_q, term_r),
-                "z": z_formula(term_r) + 0.0001,
+                "z": z_by_row[term_r] + 0.0001,
                 "color": term_color, "base_radius": radius, "opacity": 255,
                 "width": outline_width
             }
@@ -380,27 +458,31 @@ def add_river_endpoints_overlay(river_paths, notebook, persistent_state):
 
 def add_all_debug_overlays(tile_objects, river_paths, notebook, persistent_state, variable_state):
     """Calls all debug drawable functions based on the toggle switches at the top of the file."""
+
+    # Skip the whole pipeline when no overlay is enabled
+    if not _ENABLED:
+        return
     
-    # Check each toggle and call the corresponding function
-    if SHOW_HEX_CENTERS:
+    # Check each enabled overlay and call the corresponding function
+    if "centers" in _ENABLED:
         add_hex_center_overlay(tile_objects, notebook, persistent_state)
         
-    if SHOW_COORDINATES:
+    if "coordinates" in _ENABLED:
         add_qr_coordinates_overlay(tile_objects, notebook, persistent_state)
         
-    if SHOW_REGION_BORDERS:
+    if "region_borders" in _ENABLED:
         add_region_border_overlay(tile_objects, notebook, persistent_state, variable_state)
         
-    if SHOW_TERRAIN_TAGS:
+    if "terrain_tags" in _ENABLED:
         add_terrain_tag_overlay(tile_objects, notebook, persistent_state)
 
-    if SHOW_SPINE:
+    if "spine" in _ENABLED:
         add_spine_overlay(tile_objects, notebook, persistent_state)
 
-    if SHOW_RIVER_PATHS:
+    if "river_paths" in _ENABLED:
         add_river_path_overlay(river_paths, notebook, persistent_state)
 
-    if SHOW_RIVER_ENDPOINTS:
+    if "river_endpoints" in _ENABLED:
         add_river_endpoints_overlay(river_paths, notebook, persistent_state)
 
     print("[debug] ✅ Debug overlays added.")
\ No newline at end of file
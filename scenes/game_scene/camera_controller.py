@@ -1,6 +1,6 @@
 # In camera_controller.py
 import pygame, math
-from shared_helpers import hex_to_pixel
+from shared_helpers import hex_to_world_pixel
 
 class CameraController:
     """Manages all camera state, including auto-centering and zoom configuration."""
@@ -22,8 +22,17 @@ class CameraController:
         # 💾 Set pan_speed once at the start.
         self.pan_speed = pan_speed
 
+        # ⌨️ Bind the panning keys once so they can be rebound without code changes.
+        self._k_w, self._k_s, self._k_a, self._k_d = pygame.K_w, pygame.K_s, pygame.K_a, pygame.K_d
+
+        # 📐 Cache the static map measurements so per-frame code avoids dict lookups.
+        self._screen = self.persistent_state["pers_screen"]
+        map_size = self.persistent_state["pers_map_size"]
+        self._map_pixel_w_at_1x = map_size["pixel_w_1x"]
+        self._map_pixel_h_at_1x = map_size["pixel_h_1x"]
+
         # Sync internal state with the initial values from variable_state
-        self.offset = list(variable_state.get("var_render_offset", (0, 0)))
+        self.offset_x, self.offset_y = variable_state.get("var_render_offset", (0, 0))
         self.dev_quickboot = bool(persistent_state.get("pers_dev_quickboot"))
 
         if self.dev_quickboot:
@@ -32,6 +41,7 @@ class CameraController:
             self.zoom_config.update({"min_zoom": fixed, "max_zoom": fixed, "zoom_interval": 1.0})
             self.zoom = fixed
             variable_state["var_current_zoom"] = fixed
+            self._cache_zoom_limits()
 
             # Don’t run the dynamic min-zoom computation at all
             print(f"[Camera] ⚙️ Dev Quickboot: zoom locked at {fixed:.2f}.")
@@ -39,15 +49,9 @@ class CameraController:
             return
 
         # ⚙️ Calculate Dynamic Minimum Zoom
-        screen_w, screen_h = self.persistent_state["pers_screen"].get_size()
-        map_cols = self.persistent_state["pers_map_size"]["cols"]
-        map_rows = self.persistent_state["pers_map_size"]["rows"]
-
-        tile_w = self.persistent_state["pers_tile_hex_w"]
-        tile_h = self.persistent_state["pers_tile_hex_h"]
-
-        map_pixel_w_at_1x = (map_cols + 0.5) * tile_w
-        map_pixel_h_at_1x = (map_rows * 0.75 + 0.25) * tile_h
+        screen_w, screen_h = self._screen.get_size()
+        map_pixel_w_at_1x = self._map_pixel_w_at_1x
+        map_pixel_h_at_1x = self._map_pixel_h_at_1x
 
         # Determine the zoom required to fit the map's width and height to the screen.
         zoom_to_fit_width = screen_w / map_pixel_w_at_1x if map_pixel_w_at_1x > 0 else 1.0
@@ -67,6 +71,7 @@ class CameraController:
 
         # Overwrite the config's min_zoom with our new limit.
         self.zoom_config["min_zoom"] = final_min_zoom
+        self._cache_zoom_limits()
         print(f"[Camera] ✅ Min zoom with padding set to {final_min_zoom:.2f}.")
 
         # Set the initial zoom, ensuring it's not less than our new minimum.
@@ -91,8 +96,7 @@ class CameraController:
         map_center_q, map_center_r = self.persistent_state["pers_map_center"]
         
         # ✨ FIX: Get the pure "world space" pixel position, ignoring current camera state.
-        temp_variable_state = {"var_current_zoom": 1.0, "var_render_offset": (0, 0)}
-        map_center_world_px = hex_to_pixel(map_center_q, map_center_r, self.persistent_state, temp_variable_state)
+        map_center_world_px = hex_to_world_pixel(map_center_q, map_center_r, self.persistent_state)
 
         # Calculate the required offset to align the map center with the screen center
         offset_x = screen_center_px[0] - (map_center_world_px[0] * self.zoom)
@@ -105,15 +109,15 @@ class CameraController:
                 animation_type='value',
                 key_to_animate='offset',
                 drawable_type='camera_offset',
-                start_val=tuple(self.offset),
+                start_val=(self.offset_x, self.offset_y),
                 end_val=(offset_x, offset_y),
                 duration=1.0 # seconds
             )
             print(f"[Camera] ✅ Panning to center of map.")
         else:
             # Instantly set the offset and update the global state.
-            self.offset = [offset_x, offset_y]
-            self.variable_state["var_render_offset"] = tuple(self.offset)
+            self.offset_x, self.offset_y = offset_x, offset_y
+            self.variable_state["var_render_offset"] = (offset_x, offset_y)
             print(f"[Camera] ✅ Map instantly centered.")
  
     def center_on_tile(self, q, r, animated=True):        
@@ -125,8 +129,7 @@ class CameraController:
         
         # 2. Get the target tile's world pixel position (at 1x zoom)
         # We temporarily ignore the current zoom and offset for this calculation.
-        temp_variable_state = {"var_current_zoom": 1.0, "var_render_offset": (0, 0)}
-        target_world_px = hex_to_pixel(q, r, self.persistent_state, temp_variable_state)
+        target_world_px = hex_to_world_pixel(q, r, self.persistent_state)
         
         # 3. Calculate the new offset needed to align the target with the screen center,
         #    accounting for the current zoom level.
@@ -140,13 +143,13 @@ class CameraController:
                 animation_type='value',
                 key_to_animate='offset',
                 drawable_type='camera_offset',
-                start_val=tuple(self.offset),
+                start_val=(self.offset_x, self.offset_y),
                 end_val=(target_offset_x, target_offset_y),
                 duration=0.7 # seconds
             )
             print(f"[Camera] ✅ Scrolling to tile ({q},{r}).")
         else:
-            self.offset = [target_offset_x, target_offset_y]
+            self.offset_x, self.offset_y = target_offset_x, target_offset_y
             print(f"[Camera] ✅ Snapping to tile ({q},{r}).")
 
     def handle_events(self, events):
@@ -154,10 +157,9 @@ class CameraController:
 
         # Panning
         keys = pygame.key.get_pressed()
-        if keys[pygame.K_w]: self.offset[1] += self.pan_speed
-        if keys[pygame.K_s]: self.offset[1] -= self.pan_speed
-        if keys[pygame.K_a]: self.offset[0] += self.pan_speed
-        if keys[pygame.K_d]: self.offset[0] -= self.pan_speed
+        pan_speed = self.pan_speed
+        self.offset_x += (keys[self._k_a] - keys[self._k_d]) * pan_speed
+        self.offset_y += (keys[self._k_w] - keys[self._k_s]) * pan_speed
             
         if self.dev_quickboot:
             return  # ignore zoom input entirely
@@ -167,27 +169,26 @@ class CameraController:
             if event.type == pygame.MOUSEWHEEL:
 
                 # Get the screen center as our anchor point.
-                screen_w, screen_h = self.persistent_state["pers_screen"].get_size()
+                screen_w, screen_h = self._screen.get_size()
                 screen_center = (screen_w / 2, screen_h / 2)
 
                 # Find which point on the map is under the anchor BEFORE zooming.
                 old_zoom = self.zoom
-                world_point_x = (screen_center[0] - self.offset[0]) / old_zoom
-                world_point_y = (screen_center[1] - self.offset[1]) / old_zoom
+                world_point_x = (screen_center[0] - self.offset_x) / old_zoom
+                world_point_y = (screen_center[1] - self.offset_y) / old_zoom
 
                 # Apply the new zoom level and snap it to a valid step.
-                self.zoom += event.y * self.zoom_config["zoom_interval"]
+                self.zoom += event.y * self._step
                 self._snap_zoom() # self.zoom is now the final new_zoom.
 
                 # Calculate the new offset required to keep the world point at the anchor.
-                new_offset_x = screen_center[0] - (world_point_x * self.zoom)
-                new_offset_y = screen_center[1] - (world_point_y * self.zoom)
-                self.offset = [new_offset_x, new_offset_y]
+                self.offset_x = screen_center[0] - (world_point_x * self.zoom)
+                self.offset_y = screen_center[1] - (world_point_y * self.zoom)
 
     def update(self):
         """Writes the controller's current values into the global variable_state."""
         self._clamp_offset_to_bounds()
-        self.variable_state["var_render_offset"] = tuple(self.offset)
+        self.variable_state["var_render_offset"] = (self.offset_x, self.offset_y)
         self.variable_state["var_current_zoom"] = self.zoom
 
     def _snap_zoom(self):
@@ -198,56 +199,70 @@ class CameraController:
             self.zoom = round(self.zoom_config["min_zoom"], 2)
             return
         
-        config = self.zoom_config
-        step, min_z, max_z = config["zoom_interval"], config["min_zoom"], config["max_zoom"]
-        
-        # Snap to the nearest absolute multiple of the zoom interval.
-        snapped = round(self.zoom / step) * step
+        self.zoom = _snap(self.zoom, self._step, self._inv_step, self._min_z, self._max_z)
 
-        # Then, clamp the result to the dynamic min/max bounds.
-        clamped = max(min_z, min(max_z, snapped))
-        self.zoom = round(clamped, 2)
+    def _cache_zoom_limits(self):
+        """Caches the zoom step, its inverse and the bounds. Call after changing zoom_config."""
+        config = self.zoom_config
+        self._step = config["zoom_interval"]
+        self._inv_step = 1.0 / self._step
+        self._min_z = config["min_zoom"]
+        self._max_z = config["max_zoom"]
 
     def _clamp_offset_to_bounds(self):
             """Ensures the camera's offset does not allow panning past the map's edge."""
 
-            # Grab measurements from persistent state
-            screen_w, screen_h = self.persistent_state["pers_screen"].get_size()
-            map_cols = self.persistent_state["pers_map_size"]["cols"]
-            map_rows = self.persistent_state["pers_map_size"]["rows"]
-            tile_w = self.persistent_state["pers_tile_hex_w"]
-            tile_h = self.persistent_state["pers_tile_hex_h"]
-
-            # Define percentage margin
-            margin_x = screen_w * 0.15
-            margin_y = screen_h * 0.15
-
-            # Calculate map width at 1x zoom
-            map_pixel_w_at_1x = (map_cols + 0.5) * tile_w
-            map_pixel_h_at_1x = (map_rows * 0.75 + 0.25) * tile_h
-
-            # Multiply that with current zoom
-            zoomed_map_w = map_pixel_w_at_1x * self.zoom
-            zoomed_map_h = map_pixel_h_at_1x * self.zoom
+            # Only the screen size can change at runtime; the map size is cached.
+            screen_w, screen_h = self._screen.get_size()
+            self.offset_x, self.offset_y = _clamp(
+                self.offset_x, self.offset_y, screen_w, screen_h,
+                self._map_pixel_w_at_1x, self._map_pixel_h_at_1x, self.zoom, 0.15
+            )
 
-            # Since min_zoom guarantees the map is larger than the screen,
-            # we only need this simple, hard-clamping logic.
-            # The margin is then applied to the boundaries.
-            max_x = 0 - margin_x
-            max_y = 0 - margin_y
-            min_x = (screen_w - zoomed_map_w) + margin_x
-            min_y = (screen_h - zoomed_map_h) + margin_y
+    @property
+    def offset(self):
+        """The camera offset as an (x, y) tuple; the tween system animates this."""
+        return (self.offset_x, self.offset_y)
 
-            self.offset[0] = max(min_x, min(self.offset[0], max_x))
-            self.offset[1] = max(min_y, min(self.offset[1], max_y))
+    @offset.setter
+    def offset(self, value):
+        self.offset_x, self.offset_y = value
 
     def get_offset(self):
-        return tuple(self.offset)
+        return (self.offset_x, self.offset_y)
 
     def get_zoom(self):
         return self.zoom
     
     def pan(self, dx, dy):
         """Applies a positional delta to the camera's offset."""
-        self.offset[0] += dx
-        self.offset[1] += dy
\ No newline at end of file
+        self.offset_x += dx
+        self.offset_y += dy
+
+# ──────────────────────────────────────────────────
+# 📐 Scalar Camera Math
+# ──────────────────────────────────────────────────
+
+def _snap(zoom, step, inv_step, min_z, max_z):
+    """Snaps a zoom value to the nearest step and clamps it to the min/max bounds."""
+    # Snap to the nearest absolute multiple of the zoom interval.
+    snapped = round(zoom * inv_step) * step
+
+    # Then, clamp the result to the dynamic min/max bounds.
+    return round(max(min_z, min(max_z, snapped)), 2)
+
+def _clamp(offset_x, offset_y, screen_w, screen_h, map_w_1x, map_h_1x, zoom, margin_frac):
+    """Clamps a camera offset so the zoomed map never pans past the screen margins."""
+    # Define percentage margin
+    margin_x = screen_w * margin_frac
+    margin_y = screen_h * margin_frac
+
+    # Since min_zoom guarantees the map is larger than the screen,
+    # we only need this simple, hard-clamping logic.
+    # The margin is then applied to the boundaries.
+    max_x = 0 - margin_x
+    max_y = 0 - margin_y
+    min_x = (screen_w - map_w_1x * zoom) + margin_x
+    min_y = (screen_h - map_h_1x * zoom) + margin_y
+
+    return max(min_x, min(offset_x, max_x)), max(min_y, min(offset_y, max_y))
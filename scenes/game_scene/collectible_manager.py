@@ -3,7 +3,10 @@
 
 import random
 import math
-from shared_helpers import axial_distance, hex_to_pixel
+from shared_helpers import oddr_to_axial, hex_to_world_pixel
+
+# 🔊 Sounds that shouldn't play on pickup; a tuple so the audio manager can cache on it
+COLLECT_SFX_BLACKLIST = ("game_over_cartoon_2.wav", "error.wav", "try_again.wav", "earn_points.wav", "secret_area_unlock_1", "soft_fail")
 
 # ──────────────────────────────────────────────────
 # ⚙️ Collectible Manager (The "Battery")
@@ -23,6 +26,16 @@ class CollectibleManager:
 
         # 💎 State
         self.collectibles = seed_collectibles(persistent_state, tile_objects, notebook, tween_manager, players)
+        self.collectibles_by_coord = {(c.q, c.r): c for c in self.collectibles}
+        self._collectibles_version = 0  # Bumped whenever a collectible is removed
+
+        # 🧭 The last nearest-collectible result and the (q, r, version) it was found for
+        self._nearest_key = None
+        self._nearest_collectible = None
+
+        # 🧭 The inputs the indicator drawable was last built from, and its z-formula
+        self._indicator_state = None
+        self._z_indicator = persistent_state["pers_z_formulas"]["indicator"]
 
         # 👂 Event Subscriptions
         self.event_bus.subscribe("PLAYER_LANDED_ON_TILE", self.on_player_landed)
@@ -41,13 +54,14 @@ class CollectibleManager:
         if not tile: return
 
         # Check if a collectible exists at this coordinate.
-        collected_item = next((c for c in self.collectibles if (c.q, c.r) == (tile.q, tile.r)), None)
+        collected_item = self.collectibles_by_coord.pop((tile.q, tile.r), None)
         if collected_item:
             print(f"[CollectibleManager] ✅ Player {player.player_id} collected an item.")
-            self.audio_manager.play_sfx(blacklist=["game_over_cartoon_2.wav", "error.wav", "try_again.wav", "earn_points.wav", "secret_area_unlock_1", "soft_fail"])
+            self.audio_manager.play_sfx(blacklist=COLLECT_SFX_BLACKLIST)
             player.gain_evolution_points()
             collected_item.cleanup(self.notebook, self.tween_manager)
             self.collectibles.remove(collected_item)
+            self._collectibles_version += 1
             self.event_bus.post("REQUEST_HAZARD_EVENT", {"trigger": "collectible"})
 
     def on_active_player_changed(self, player):
@@ -55,14 +69,26 @@ class CollectibleManager:
         self.active_player = player
 
     def _find_nearest_collectible(self):
-        """Finds the active player's nearest collectible."""
-        if not self.collectibles:
-            return None
+        """
+        Finds the active player's nearest collectible. The result only changes when the player
+        stands on a new tile or a collectible is removed, so it's rescanned only then.
+        """
+        player = self.active_player
+        key = (player.q, player.r, self._collectibles_version)
+        if key == self._nearest_key:
+            return self._nearest_collectible
 
-        return min(
-            self.collectibles,
-            key=lambda c: axial_distance(self.active_player.q, self.active_player.r, c.q, c.r)
-        )
+        # 📏 Hex distance inlined against each collectible's cached axial coords
+        nearest = None
+        if self.collectibles:
+            px, pz = oddr_to_axial(player.q, player.r)
+            nearest = min(
+                self.collectibles,
+                key=lambda c: (abs(c.ax - px) + abs(c.az - pz) + abs(c.ax - px + c.az - pz)) // 2
+            )
+        self._nearest_key = key
+        self._nearest_collectible = nearest
+        return nearest
 
     def _update_nearest_collectible_indicator(self):
         """Calculates the angle to the nearest collectible and updates the drawable."""
@@ -74,26 +100,35 @@ class CollectibleManager:
         if not nearest_collectible or not player_token:
             if indicator_key in self.notebook:
                 del self.notebook[indicator_key]
+            self._indicator_state = None
             return
-            
-        world_variable_state = {"var_current_zoom": 1.0, "var_render_offset": (0,0)}
 
-        if 'pixel_pos' in player_token: 
-            player_pos = player_token['pixel_pos'] 
+        # 🛑 Nothing the indicator depends on has changed since it was last built
+        pixel_pos = player_token.get('pixel_pos')
+        state = (player.q, player.r, pixel_pos, nearest_collectible)
+        if state == self._indicator_state and indicator_key in self.notebook:
+            return
+        self._indicator_state = state
+
+        if pixel_pos is not None: 
+            player_pos = pixel_pos 
         else: 
-            player_pos = hex_to_pixel(player.q, player.r, self.persistent_state, world_variable_state)
+            player_pos = hex_to_world_pixel(player.q, player.r, self.persistent_state)
 
-        target_pos = hex_to_pixel(nearest_collectible.q, nearest_collectible.r, self.persistent_state, world_variable_state)
+        target_pos = hex_to_world_pixel(nearest_collectible.q, nearest_collectible.r, self.persistent_state)
  
         dx = target_pos[0] - player_pos[0]
         dy = target_pos[1] - player_pos[1]
         angle_deg = math.degrees(math.atan2(-dy, dx))
 
-        z_formula = self.persistent_state["pers_z_formulas"]["indicator"]
-        self.notebook[indicator_key] = {
-            "type": "indicator", "q": player.q, "r": player.r,
-            "anchor_world_pos": player_pos, "angle": angle_deg, "z": z_formula(player.r)
-        }
+        # ✨ Update the existing drawable in place, creating it only when missing
+        indicator = self.notebook.get(indicator_key)
+        if indicator is None:
+            indicator = self.notebook[indicator_key] = {"type": "indicator"}
+        indicator["q"], indicator["r"] = player.q, player.r
+        indicator["anchor_world_pos"] = player_pos
+        indicator["angle"] = angle_deg
+        indicator["z"] = self._z_indicator(player.r)
 
 # ──────────────────────────────────────────────────
 # 🏭 Seeding Function
@@ -186,6 +221,7 @@ class Collectible:
         # ⚙️ Store core state
         self.q = q
         self.r = r
+        self.ax, self.az = oddr_to_axial(q, r)  # Axial form, for distance checks
         
         # 🎨 Create Drawables in the Notebook
         # Define unique keys for all visual components.
@@ -6,12 +6,11 @@ class EventBus:
 
     def subscribe(self, event_type, listener):
         """Register a listener function for a specific event type."""
-        if event_type not in self.listeners:
-            self.listeners[event_type] = []
-        self.listeners[event_type].append(listener)
+        self.listeners.setdefault(event_type, []).append(listener)
 
     def post(self, event_type, data=None):
         """Post an event to all registered listeners."""
-        if event_type in self.listeners:
-            for listener in self.listeners[event_type]:
-                listener(data)
\ No newline at end of file
+        listeners = self.listeners.get(event_type)
+        if listeners:
+            for listener in listeners:
+                listener(data)
@@ -1,14 +1,20 @@
 # game_manager.py
 # This class orchestrates the game's state, including turns and active players.
 
-import random, math
-from shared_helpers import axial_distance, hex_to_pixel
-
 DEBUG = True
+LOG_TURN_FLOW = False   # Per-turn and per-click status prints; off to keep them off the input path
 
 class GameManager:
     """Manages the overall game state, turn progression, and active player."""
 
+    # 🧱 Fixed attribute layout; every attribute is assigned in __init__
+    __slots__ = (
+        "players", "camera_controller", "tile_objects", "event_bus", "tween_manager", "hazard_manager",
+        "persistent_state", "notebook", "_players_by_coord",
+        "turn_counter", "active_player_index", "active_player", "is_paused",
+        "selected_player", "is_player_moving", "active_migration_event",
+    )
+
     def __init__(self, players, camera_controller, tile_objects, event_bus, notebook, persistent_state, tween_manager, hazard_manager):
         
         # Stores references to the core game systems
@@ -23,9 +29,13 @@ class GameManager:
         self.persistent_state = persistent_state
         self.notebook = notebook
         
+        # 🗺️ Index players by their tile so clicks resolve with one lookup
+        self._index_player_coords()
+
         # Initializes the turn and player counters
         self.turn_counter = 1
         self.active_player_index = 0
+        self.active_player = self.players[0]
 
         # Pauses the game by default at the start
         self.is_paused = True
@@ -49,11 +59,9 @@ class GameManager:
         """The main update loop for the GameManager, called every frame."""
         pass # The GameManager currently has no per-frame updates.
 
-    @property
-    def active_player(self):
-        """A convenient property to get the current active player object."""
-        # Returns the player object at the current active player index
-        return self.players[self.active_player_index]
+    def _index_player_coords(self):
+        """Rebuilds the coord→player lookup, keeping the first player in list order on shared tiles."""
+        self._players_by_coord = {(p.q, p.r): p for p in reversed(self.players)}
 
     def _setup_turn_for_player(self, player):
         """A centralized helper to prepare a player's state at the start of their turn."""
@@ -71,7 +79,7 @@ class GameManager:
 
         # 📢 Announce that the first turn has officially begun.
         self.event_bus.post("TURN_STARTED", {"player": self.active_player})
-        print(f"[GameManager] ✅ Game Start! Turn {self.turn_counter}, Player {self.active_player.player_id}'s turn.")
+        if LOG_TURN_FLOW: print(f"[GameManager] ✅ Game Start! Turn {self.turn_counter}, Player {self.active_player.player_id}'s turn.")
 
         # ✨ Set the initial glow state for the first player.
         self.on_active_player_changed(self.active_player)
@@ -91,14 +99,11 @@ class GameManager:
         if self.is_paused: return
 
         # Deselects the previously selected player
-        if self.selected_player:
-            previous_coord = (self.selected_player.q, self.selected_player.r)
-            if self.tile_objects.get(previous_coord):
-                self.tile_objects[previous_coord].is_selected = False
-            self.selected_player = None
+        self._clear_selection()
 
         # Advance to the next player in the list
         self.active_player_index = (self.active_player_index + 1) % len(self.players)
+        self.active_player = self.players[self.active_player_index]
 
         # 📢 Announce that the active player has officially changed.
         self.event_bus.post("ACTIVE_PLAYER_CHANGED", self.active_player)
@@ -111,7 +116,7 @@ class GameManager:
             self.turn_counter += 1
         
         # Announce the new turn, but wait for the migration event before setting up movement.
-        print(f"[GameManager] ✅ Turn {self.turn_counter}, Player {self.active_player.player_id}'s turn beginning...")
+        if LOG_TURN_FLOW: print(f"[GameManager] ✅ Turn {self.turn_counter}, Player {self.active_player.player_id}'s turn beginning...")
 
         # 🎥 Announce that the camera should center on the new active player.
         self.event_bus.post("CENTER_CAMERA_ON_TILE", {
@@ -139,11 +144,11 @@ class GameManager:
         if self.is_paused: return
 
         # Did the user click on a player token?
-        for player in self.players:
-            if (player.q, player.r) == coord:
-                # Selects the player and handles the selection logic
-                self._select_player(player)
-                return
+        player = self._players_by_coord.get(coord)
+        if player:
+            # Selects the player and handles the selection logic
+            self._select_player(player)
+            return
 
         # If not, was it a valid move command for the selected player?
         clicked_tile = self.tile_objects.get(coord)
@@ -165,32 +170,36 @@ class GameManager:
         # Deselects whatever is currently selected
         self._select_player(None)
 
+    def _clear_selection(self):
+        """Clears the selected player and the selection flag on their tile."""
+        if self.selected_player:
+            if previous_tile := self.tile_objects.get((self.selected_player.q, self.selected_player.r)):
+                previous_tile.is_selected = False
+            self.selected_player = None
+
     def _select_player(self, player_to_select):
         """Handles the logic for selecting a player and showing their overlays."""
 
-        if self.selected_player:
-            previous_coord = (self.selected_player.q, self.selected_player.r)
-            if self.tile_objects.get(previous_coord):
-                self.tile_objects[previous_coord].is_selected = False
-            self.selected_player = None
+        # Re-selecting the current selection keeps its tile flag instead of clearing and setting it again
+        if player_to_select is None or player_to_select is not self.selected_player:
+            self._clear_selection()
 
         if not player_to_select:
             return
 
         # If we have a valid player, proceed with selecting them
         self.selected_player = player_to_select
-        coord = (player_to_select.q, player_to_select.r)
-        if self.tile_objects.get(coord):
+        if tile := self.tile_objects.get((player_to_select.q, player_to_select.r)):
 
             # Sets the is_selected flag for the tile to enable a visual effect
-            self.tile_objects[coord].is_selected = True
+            tile.is_selected = True
 
         # If the selected player is the active one, tell the UI to show the overlay
         if player_to_select is self.active_player:
-            print(f"[GameManager] ✅ Selected active player {player_to_select.player_id}.")
+            if LOG_TURN_FLOW: print(f"[GameManager] ✅ Selected active player {player_to_select.player_id}.")
             self.event_bus.post("ACTIVE_PLAYER_SELECTED", player_to_select)
         else:
-            print(f"[GameManager] ✅ Selected non-active player {player_to_select.player_id}.")
+            if LOG_TURN_FLOW: print(f"[GameManager] ✅ Selected non-active player {player_to_select.player_id}.")
             self.event_bus.post("NON_ACTIVE_PLAYER_SELECTED", player_to_select)
 
     def add_resource_to_active_player_tile(self, resource_type="stone"):
@@ -270,6 +279,9 @@ class GameManager:
         tile = data["tile"]
         path_cost = data["path_cost"]
 
+        # The player has moved, so refresh the click lookup
+        self._index_player_coords()
+
         if not tile: return
 
         # --- Consequence 2: Apply Movement Penalties ---
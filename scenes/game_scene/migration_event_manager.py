@@ -20,7 +20,7 @@ class MigrationEvent:
         self.event_id = event_id            # Unique identifier, e.g., "desert_hazard"
         self.description = description      # Text displayed on the panel
         self.trigger_type = trigger_type    # The condition, e.g., "enter_terrain"
-        self.trigger_param = trigger_param  # The trigger's data, e.g., ["DesertDunes"]
+        self.trigger_param = trigger_param  # The trigger's data, e.g., frozenset({"DesertDunes"})
         self.is_enabled = is_enabled        # For black/whitelisting
 
 # ──────────────────────────────────────────────────
@@ -32,6 +32,7 @@ class MigrationEventManager:
     def __init__(self, event_bus):
         self.event_bus = event_bus
         self.events = []
+        self._eligible_events = ()
         self.active_event = None
         self.event_bus.subscribe("PLAYER_LANDED_ON_TILE", self.on_player_landed)
         self._initialize_events()
@@ -44,43 +45,48 @@ class MigrationEventManager:
                 event_id="desert_hazard",
                 description="Entering Desert terrain is hazardous.",
                 trigger_type="enter_terrain",
-                trigger_param=["DesertDunes"]
+                trigger_param=frozenset({"DesertDunes"})
             ),
             MigrationEvent(
                 event_id="scrub_hazard",
                 description="Entering Scrublands is hazardous.",
                 trigger_type="enter_terrain",
-                trigger_param=["Scrublands"]
+                trigger_param=frozenset({"Scrublands"})
             ),
             MigrationEvent(
                 event_id="marsh_hazard",
                 description="Entering a Marsh is hazardous.",
                 trigger_type="enter_terrain",
-                trigger_param=["Marsh"]
+                trigger_param=frozenset({"Marsh"})
             ),
             MigrationEvent(
                 event_id="highland_hazard",
                 description="Entering Highlands or Hills is hazardous.",
                 trigger_type="enter_terrain",
-                trigger_param=["Highlands", "Hills"]
+                trigger_param=frozenset({"Highlands", "Hills"})
             ),
             MigrationEvent(
                 event_id="forest_hazard",
                 description="Entering a Forest is hazardous.",
                 trigger_type="enter_terrain",
-                trigger_param=["Woodlands", "ForestBroadleaf"]
+                trigger_param=frozenset({"Woodlands", "ForestBroadleaf"})
             ),
             MigrationEvent(
                 event_id="plains_hazard",
                 description="Entering the Plains is hazardous.",
                 trigger_type="enter_terrain",
-                trigger_param=["Plains"]
+                trigger_param=frozenset({"Plains"})
             )
         ]
         self.events.extend(event_data)
+        self._refresh_eligible_events()
         if DEBUG:
             print(f"[MigrationManager] ✅ Initialized with {len(self.events)} events.")
 
+    def _refresh_eligible_events(self):
+        """Rebuilds the enabled-event tuple. Call after anything changes the event list or an event's is_enabled."""
+        self._eligible_events = tuple(e for e in self.events if e.is_enabled)
+
     def add_event(self, event):
         """Adds a new MigrationEvent to the list."""
         pass # To be implemented
@@ -95,7 +101,7 @@ class MigrationEventManager:
 
     def select_random_event(self):
         """Selects a random, enabled event for the start of a turn."""
-        eligible_events = [e for e in self.events if e.is_enabled]
+        eligible_events = self._eligible_events
         if not eligible_events:
             if DEBUG: print("[MigrationManager] ⚠️ No eligible events to select from.")
             return None
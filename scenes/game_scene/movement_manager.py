@@ -1,15 +1,15 @@
 # scenes/game_scene/movement_manager.py
 # A consolidated, self-contained "Power Tool & Battery" for the entire Movement System.
 
-import pygame
 import heapq
-from shared_helpers import pixel_to_hex, axial_distance, get_neighbors
+from shared_helpers import HEX_NEIGHBOR_OFFSETS, axial_distance, axial_to_oddr, oddr_to_axial
 
 # ────────────────────────────────────────────────── #
 # 🎨 Config & Constants
 # ────────────────────────────────────────────────── #
 
 DEBUG = False
+RANGE_CACHE_SIZE = 64   # Reachable-range searches kept before the oldest is evicted
 
 # ────────────────────────────────────────────────── #
 # 🎨 Movement View (The "Power Tool")
@@ -24,63 +24,109 @@ class MovementView:
         self.persistent_state = persistent_state
         
         # 🚩 State Management
-        self.active_player_move_range = []
-        self.path_keys = []
+        self.active_player_move_range = set()
+        self._move_tiles = []
+        self.path_coords = []
+        self.path_type = None
         self.is_visible = False
         self.last_path_target = None
 
+        # 📏 Path segment z only depends on the row, so evaluate it once per map row
+        z_formula = persistent_state["pers_z_formulas"]['path_curve']
+        self._path_z_by_row = {r: z_formula(r) for r in {r for _, r in tile_objects}}
+
     def set_overlay_data(self, overlay_data):
         """Receives movement data from the MovementManager and applies the tile colors."""
-        # 🧹 Clear old color tags from the previous overlay
-        for coord in self.active_player_move_range:
-            if tile := self.tile_objects.get(coord):
+        old_range = self.active_player_move_range
+        new_range = set(overlay_data)
+
+        # 🧹 Clear old color tags and visibility only from tiles leaving the range;
+        # tiles that stay in range are overwritten below
+        for tile in self._move_tiles:
+            if (tile.q, tile.r) not in new_range:
                 tile.primary_move_color = None
                 tile.secondary_move_color = None
+                tile.movement_overlay = False
         
-        # 💾 Store the new range and apply new colors
-        self.active_player_move_range = list(overlay_data.keys())
+        # 💾 Store the new range and its resolved tiles, then apply new colors.
+        # Only tiles entering the range need their visibility matched to the overlay's.
+        is_visible = self.is_visible
+        self.active_player_move_range = new_range
+        self._move_tiles = []
         for coord, data in overlay_data.items():
             if tile := self.tile_objects.get(coord):
                 tile.primary_move_color = data["primary"]
                 tile.secondary_move_color = data.get("secondary")
+                if coord not in old_range:
+                    tile.movement_overlay = is_visible
+                self._move_tiles.append(tile)
 
     def toggle_visibility(self, is_visible):
         """Sets the visibility of the pre-calculated movement overlay."""
-        self.is_visible = is_visible
         # 🧹 Hide the path preview line when the main overlay is hidden
         if not is_visible:
             self.update_path_overlay(None)
 
+        # 🛑 Tiles already match the overlay's state, since set_overlay_data keeps them in sync
+        if is_visible == self.is_visible:
+            return
+        self.is_visible = is_visible
+
         # ✨ Apply the visibility flag to all tiles in the current range
-        for coord in self.active_player_move_range:
-            if tile := self.tile_objects.get(coord):
-                tile.movement_overlay = is_visible
+        for tile in self._move_tiles:
+            tile.movement_overlay = is_visible
 
     def update_path_overlay(self, path, is_gliding=False):
-        """Receives a final, calculated path and creates the drawable objects for it."""
-        # 🧹 Clear any old path segments from the notebook.
-        for key in self.path_keys:
-            if key in self.notebook:
-                del self.notebook[key]
-        self.path_keys.clear()
-
-        # 🎨 If a valid path is provided, create the new drawables.
-        if path and len(path) > 1:
-            z_formula = self.persistent_state["pers_z_formulas"]['path_curve']
-
-            # ✨ Determine the drawable type based on whether it's a glide path
-            drawable_type = 'path_curve_glide' if is_gliding else 'path_curve'
-
-            for i, current_coord in enumerate(path):
-                prev_coord = path[i-1] if i > 0 else None
-                next_coord = path[i+1] if i < len(path) - 1 else None
-                key = f"path_curve_{i}"
-                self.notebook[key] = {
+        """
+        Receives a final, calculated path and updates the drawable objects for it. Segments
+        shared with the previously drawn path are left alone, and the rest are rewritten in place.
+        """
+        notebook = self.notebook
+        if not path or len(path) < 2:
+            # 🛑 Nothing drawn and nothing to draw, so there's nothing to clear
+            if not self.path_coords:
+                return
+            path = []
+
+        # ✨ Determine the drawable type based on whether it's a glide path
+        drawable_type = 'path_curve_glide' if is_gliding else 'path_curve'
+
+        # 🔍 Find how much of the old path is unchanged (a type change redraws everything)
+        last_path = self.path_coords
+        shared = 0
+        if drawable_type == self.path_type:
+            limit = min(len(path), len(last_path))
+            while shared < limit and path[shared] == last_path[shared]:
+                shared += 1
+
+        # 🎨 Rewrite from the last shared segment on, since its exit may now point elsewhere.
+        # Segments that don't exist yet are collected and added in one bulk update.
+        added = {}
+        if path:
+            z_by_row = self._path_z_by_row
+            last_index = len(path) - 1
+            for i in range(max(shared - 1, 0), len(path)):
+                current_coord = path[i]
+                fields = {
                     'type': drawable_type, 'coord': current_coord,
-                    'prev_coord': prev_coord, 'next_coord': next_coord, 
-                    'z': z_formula(current_coord[1]),
+                    'prev_coord': path[i-1] if i > 0 else None,
+                    'next_coord': path[i+1] if i < last_index else None,
+                    'z': z_by_row[current_coord[1]],
                 }
-                self.path_keys.append(key)
+                key = f"path_curve_{i}"
+                segment = notebook.get(key) if i < len(last_path) else None
+                if segment is not None:
+                    segment.update(fields)
+                else:
+                    added[key] = fields
+        notebook.update(added)
+
+        # 🧹 Remove old segments past the end of the new path
+        for i in range(len(path), len(last_path)):
+            notebook.pop(f"path_curve_{i}", None)
+
+        self.path_coords = path
+        self.path_type = drawable_type
 
 
 # ────────────────────────────────────────────────── #
@@ -111,6 +157,15 @@ class MovementManager:
         # movement data for the current player's turn. It is generated once
         # at the start of the turn and after every move.
         self.turn_context_data = {}
+        self.valid_destinations = frozenset()   # Coords from the checklist that can be moved to
+        self.path_parents = {}                  # glidable flag -> (landed_from, traversed_from) from the range searches
+
+        # 🗺️ Reachable-range search results, keyed by everything the search depends on
+        self._range_cache = {}
+
+        # 🎯 A* heuristic values for the current path target, reused across hover and move searches
+        self._h_cache = {}
+        self._h_cache_target = None
         
         # 👂 Event Subscriptions
         self.event_bus.subscribe("REQUEST_PLAYER_MOVE", self.on_move_request)
@@ -166,14 +221,13 @@ class MovementManager:
             return
         
         # 🧠 Read from our pre-computed checklist instead of calculating on the fly.
-        target_context = self.turn_context_data.get(hovered_coord)
-        if not target_context or not target_context.get("valid_destination"):
+        if hovered_coord not in self.valid_destinations:
             self.view.update_path_overlay(None)
             return
 
-        # ✅ If the destination is valid, calculate and draw the path.
-        is_gliding = target_context.get("glidable", False)
-        path = self._calculate_movement_path(
+        # ✅ If the destination is valid, walk the range search's parents back to the player and draw the path.
+        is_gliding = self.turn_context_data[hovered_coord].get("glidable", False)
+        path = self._get_movement_path(
             start_coord=(self.active_player.q, self.active_player.r),
             end_coord=hovered_coord,
             is_gliding_move=is_gliding
@@ -188,13 +242,12 @@ class MovementManager:
         if self.is_player_moving: return
 
         # 🧠 Look up the destination in our checklist to see if it's valid and how to get there.
-        target_context = self.turn_context_data.get(destination_coord)
-        if not target_context or not target_context.get("valid_destination"):
+        if destination_coord not in self.valid_destinations:
             print(f"[MovementManager] ⚠️ Click on invalid destination {destination_coord}.")
             return
 
-        is_gliding = target_context.get("glidable", False)
-        path_coords = self._calculate_movement_path(
+        is_gliding = self.turn_context_data[destination_coord].get("glidable", False)
+        path_coords = self._get_movement_path(
             (player.q, player.r), 
             destination_coord, 
             is_gliding_move=is_gliding
@@ -238,6 +291,8 @@ class MovementManager:
     def _clear_turn_context_data(self):
         """Clears the pre-computed checklist. Called between turns."""
         self.turn_context_data.clear()
+        self.valid_destinations = frozenset()
+        self.path_parents = {}
 
 
     def _generate_turn_context_data(self):
@@ -256,47 +311,47 @@ class MovementManager:
 
 
         # ⚙️ 2. Run the ground-based pathfinding search
-        ground_validator = self._build_active_player_movement_rules(player, move_mode='ground')
-        ground_costs = self._Dijkstra_search(
-            start_coord=start_coord,
-            max_movement=player.remaining_movement,
-            move_validator=ground_validator
-        )
+        ground_costs, landed_from, traversed_from = self._cached_range_search(player, start_coord, move_mode='ground')
+        self.path_parents[False] = (landed_from, traversed_from)
 
         # ⚙️ 3. Run the glide-based pathfinding search (if the player can glide)
         glide_costs = {}
         if "glide" in player.pathfinding_profiles:
             is_launch_turn = start_tile.terrain in ["Highlands", "Hills"]
-            aerial_validator = self._build_active_player_movement_rules(player, move_mode='glide', is_launch_turn=is_launch_turn)
-            glide_costs = self._Dijkstra_search(
-                start_coord=start_coord,
-                max_movement=player.remaining_movement,
-                move_validator=aerial_validator
-            )
+            glide_costs, landed_from, traversed_from = self._cached_range_search(player, start_coord, move_mode='glide', is_launch_turn=is_launch_turn)
+            self.path_parents[True] = (landed_from, traversed_from)
 
         # 🧑‍🍳 4. Synthesize the final "checklist" from the search results
         report_lines = [] # DEBUG: Initialize a list to hold our report lines.
 
         # ✨ Get a set of all unique coordinates from both searches
-        all_reachable_coords = set(ground_costs.keys()) | set(glide_costs.keys())
+        all_reachable_coords = ground_costs.keys() | glide_costs.keys()
+
+        # ⚡ The destination rules and interaction lookup are constant across the loop, so build them once
+        validators = {
+            False: self._build_active_player_movement_rules(player, 'ground'),
+            True: self._build_active_player_movement_rules(player, 'glide'),
+        }
+        get_interaction = self._build_tile_interaction(player)
+        get_tile = self.tile_objects.get
+        inf = float('inf')
 
         for coord in all_reachable_coords:
 
-            tile = self.tile_objects.get(coord)
+            tile = get_tile(coord)
             if not tile: continue
 
 
             # ✨ Determine the cheapest cost and if gliding is the better/only option
-            cost_g = ground_costs.get(coord, float('inf'))
-            cost_a = glide_costs.get(coord, float('inf'))
+            cost_g = ground_costs.get(coord, inf)
+            cost_a = glide_costs.get(coord, inf)
             final_cost = min(cost_g, cost_a)
             is_gliding_path = cost_a <= cost_g
 
             # ✨ Determine final validity based on the CHEAPEST path's rules
-            validator = self._build_active_player_movement_rules(player, 'glide' if is_gliding_path else 'ground')
-            valid_destination = validator(None, tile, is_destination=True)
+            valid_destination = validators[is_gliding_path](None, tile, is_destination=True)
 
-            interaction = self._get_tile_interaction(player, tile)
+            interaction = get_interaction(tile)
 
             self.turn_context_data[coord] = {
                 "interaction": interaction,
@@ -306,9 +361,14 @@ class MovementManager:
             }
 
             # DEBUG: Format a line for the report and add it to our list.
-            report_line = f"  - Tile {str(coord):<8} ({tile.terrain:<12}): Interaction={str(interaction):<8} | Cost={final_cost} | Glide={str(is_gliding_path):<5} | Dest={valid_destination}"
-            report_lines.append(report_line)
+            if DEBUG:
+                report_line = f"  - Tile {str(coord):<8} ({tile.terrain:<12}): Interaction={str(interaction):<8} | Cost={final_cost} | Glide={str(is_gliding_path):<5} | Dest={valid_destination}"
+                report_lines.append(report_line)
         
+        self.valid_destinations = frozenset(
+            coord for coord, data in self.turn_context_data.items() if data["valid_destination"]
+        )
+
         # DEBUG: Print the entire formatted report at once.
         if DEBUG and report_lines:
             print("\n---------------------------------------------------------------------")
@@ -319,7 +379,29 @@ class MovementManager:
             print("\n".join(sorted(report_lines, key=lambda x: eval(x.split()[2]))))
             print("--------------------------- End of Report ---------------------------\n")
 
-        print(f"[MovementManager] ✅ Context generated for Player {player.player_id}. {len(self.turn_context_data)} tiles processed.")
+        if DEBUG: print(f"[MovementManager] ✅ Context generated for Player {player.player_id}. {len(self.turn_context_data)} tiles processed.")
+
+    def _cached_range_search(self, player, start_coord, move_mode, is_launch_turn=False):
+        """
+        Returns the Dijkstra (costs, landed_from, traversed_from) for a player's move from start_coord,
+        reusing a previous result when the same player and species search from the same spot with the
+        same budget. Tiles don't change during play, so the key covers every input to the validator.
+        """
+        key = (player.player_id, player.species_name, start_coord, player.remaining_movement, move_mode, is_launch_turn)
+        result = self._range_cache.get(key)
+        if result is None:
+            validator = self._build_active_player_movement_rules(player, move_mode=move_mode, is_launch_turn=is_launch_turn)
+            result = self._Dijkstra_search(
+                start_coord=start_coord,
+                max_movement=player.remaining_movement,
+                move_validator=validator
+            )
+
+            # Evict the oldest entry once the cache is full (dicts keep insertion order)
+            if len(self._range_cache) >= RANGE_CACHE_SIZE:
+                del self._range_cache[next(iter(self._range_cache))]
+            self._range_cache[key] = result
+        return result
 
     def _apply_overlay_from_context(self):
         """Reads the pre-computed checklist and passes the data to the view for rendering."""
@@ -337,17 +419,38 @@ class MovementManager:
         # 🌪️ 3. Add secondary overlays for migration events, if active.
         if self.active_migration_event:
             # ✨ Only check tiles that are already part of the valid move range.
-            for coord in overlay_data:
-                tile = self.tile_objects.get(coord)
-                trigger_type = self.active_migration_event.trigger_type
-                trigger_param = self.active_migration_event.trigger_param
-                # ✨ Check if the tile's terrain triggers the event condition.
-                if tile and trigger_type == "enter_terrain" and tile.terrain in trigger_param:
-                    overlay_data[coord]["secondary"] = "hazard"
+            trigger_type = self.active_migration_event.trigger_type
+            trigger_param = self.active_migration_event.trigger_param
+            if trigger_type == "enter_terrain":
+                get_tile = self.tile_objects.get
+                for coord, data in overlay_data.items():
+                    tile = get_tile(coord)
+                    # ✨ Check if the tile's terrain triggers the event condition.
+                    if tile and tile.terrain in trigger_param:
+                        data["secondary"] = "hazard"
 
         # 🚀 4. Send the completed data to the view.
         self.view.set_overlay_data(overlay_data)
 
+    def _get_movement_path(self, start_coord, end_coord, is_gliding_move=False):
+        """
+        Rebuilds the cheapest path to a checklist destination from the range search's parent maps.
+        The search used the same rules and unit step costs as A*, so this is one of its shortest paths.
+        Falls back to a fresh search if the parents don't lead back to start_coord.
+        """
+        parents = self.path_parents.get(is_gliding_move)
+        if parents:
+            landed_from, traversed_from = parents
+            current = landed_from.get(end_coord)
+            path = [end_coord]
+            while current is not None:
+                path.append(current)
+                current = traversed_from.get(current)
+            if path[-1] == start_coord and len(path) > 1:
+                path.reverse()
+                return path
+        return self._calculate_movement_path(start_coord, end_coord, is_gliding_move)
+
     def _calculate_movement_path(self, start_coord, end_coord, is_gliding_move=False):
         """Finds a single, valid path using A*, using the specified move rules."""
         # ✨ We need to know if the player is launching to build the correct validator
@@ -355,7 +458,10 @@ class MovementManager:
         is_launch_turn = is_gliding_move and start_tile.terrain in ["Highlands", "Hills"]
         move_mode = 'glide' if is_gliding_move else 'ground'
         validator = self._build_active_player_movement_rules(self.active_player, move_mode, is_launch_turn)
-        return self._Astar_search(start_coord, end_coord, validator)
+
+        # ⚡ An unobstructed straight line is already a shortest path, so only fall back to A* when blocked
+        return (self._straight_line_path(start_coord, end_coord, validator)
+                or self._Astar_search(start_coord, end_coord, validator))
 
     # ────────────────────────────────────────────────── #
     # ⚙️ Rule Builder & Logic Cascade
@@ -371,7 +477,7 @@ class MovementManager:
             move_mode (str): 'ground' or 'glide'.
             is_launch_turn (bool): True if a glider is launching from high ground.
          """
-
+        get_interaction = self._build_tile_interaction(player)
 
         def is_valid_move(from_tile, to_tile, is_destination):
             # 🛑 UNIVERSAL RULE: Base passability and map rules always apply.
@@ -395,7 +501,7 @@ class MovementManager:
 
             # 🧠 GROUND RULE / FINAL DESTINATION RULE:
             # A grounded step or the final landing spot requires a valid habitat interaction.
-            interaction = self._get_tile_interaction(player, to_tile)
+            interaction = get_interaction(to_tile)
             if interaction is None: return False
 
             # 🛑 GROUND RULE: Grounded creatures cannot move through difficult terrain.
@@ -418,35 +524,56 @@ class MovementManager:
             return False
         return True
 
-    def _get_tile_interaction(self, player, tile):
-        if "riverine" in player.pathfinding_profiles and getattr(tile, 'river_data', None):
-            return "good"
-        return player.terrain_interactions.get(tile.terrain)
+    def _build_tile_interaction(self, player):
+        """Returns a tile -> interaction lookup with the player's riverine check and habitat map resolved once."""
+        is_riverine = "riverine" in player.pathfinding_profiles
+        interactions_get = player.terrain_interactions.get
+
+        def get_interaction(tile):
+            if is_riverine and getattr(tile, 'river_data', None):
+                return "good"
+            return interactions_get(tile.terrain)
+
+        return get_interaction
 
     # ────────────────────────────────────────────────── #
     # 🧭 Pathfinding Algorithms (Unchanged)
     # ────────────────────────────────────────────────── #
 
     def _Dijkstra_search(self, start_coord, max_movement, move_validator, **kwargs):
-        """Finds all reachable tiles and the cost to reach them."""
+        """
+        Finds all reachable tiles and the cost to reach them. Returns (cost_so_far, landed_from,
+        traversed_from): the parent maps for landing on a tile and for passing through it.
+        """
         # ✨ This version correctly separates the cost to land on a tile (cost_so_far)
         # from the cost to travel through it (cost_to_traverse).
         cost_so_far = {start_coord: 0}
         cost_to_traverse = {start_coord: 0}
+        landed_from = {}
+        traversed_from = {start_coord: None}
         frontier = [(0, start_coord)]
         start_tile = self.tile_objects.get(start_coord) # ✨ Get start tile for validator
+        get_tile = self.tile_objects.get
+        neighbor_offsets = HEX_NEIGHBOR_OFFSETS
+        inf = float('inf')
+
+        # ⚡ Landing rules only look at the tile being landed on, never where the step came from,
+        # so each tile's destination check is run once per search instead of once per incoming edge
+        can_land = {}
 
         while frontier:
             current_cost, current_coord = heapq.heappop(frontier)
-            current_tile = self.tile_objects.get(current_coord)
+            current_tile = get_tile(current_coord)
 
 
             # Use cost_to_traverse for the frontier check
-            if current_cost > cost_to_traverse.get(current_coord, float('inf')):
+            if current_cost > cost_to_traverse.get(current_coord, inf):
                 continue
 
-            for next_coord in get_neighbors(current_coord[0], current_coord[1], self.persistent_state):
-                next_tile = self.tile_objects.get(next_coord)
+            q, r = current_coord
+            for dq, dr in neighbor_offsets[r & 1]:
+                next_coord = (q + dq, r + dr)
+                next_tile = get_tile(next_coord)
                 if not next_tile: continue
 
                 new_cost = current_cost + 1
@@ -454,32 +581,85 @@ class MovementManager:
                     continue
 
                 # 1. Check if the tile is a valid FINAL DESTINATION for pathing
-                if move_validator(current_tile, next_tile, is_destination=True):
-                    if new_cost < cost_so_far.get(next_coord, float('inf')):
+                landable = can_land.get(next_coord)
+                if landable is None:
+                    landable = can_land[next_coord] = move_validator(current_tile, next_tile, is_destination=True)
+                if landable:
+                    if new_cost < cost_so_far.get(next_coord, inf):
                         cost_so_far[next_coord] = new_cost
+                        landed_from[next_coord] = current_coord
                 
                 # 2. Check if the tile is PASSABLE as an intermediate step
                 if move_validator(current_tile, next_tile, is_destination=False):
-                    if new_cost < cost_to_traverse.get(next_coord, float('inf')):
+                    if new_cost < cost_to_traverse.get(next_coord, inf):
                         cost_to_traverse[next_coord] = new_cost
+                        traversed_from[next_coord] = current_coord
                         heapq.heappush(frontier, (new_cost, next_coord))
 
-        return cost_so_far
+        return cost_so_far, landed_from, traversed_from
+
+    def _straight_line_path(self, start_coord, end_coord, move_validator):
+        """
+        Walks the straight hex line from start to end. Every step costs 1 and the line has
+        exactly axial_distance steps, so if each step passes the validator it is a shortest
+        path; otherwise returns None.
+        """
+        steps = axial_distance(*start_coord, *end_coord)
+        if steps == 0: return None
+
+        # Lerp in cube space from a slightly nudged start so ties on hex edges round consistently
+        ax, az = oddr_to_axial(*start_coord)
+        bx, bz = oddr_to_axial(*end_coord)
+        ax += 1e-6; az += 2e-6
+
+        get_tile = self.tile_objects.get
+        from_tile = get_tile(start_coord)
+        path = [start_coord]
+        for i in range(1, steps + 1):
+            t = i / steps
+            fx = ax + (bx - ax) * t
+            fz = az + (bz - az) * t
+            fy = -fx - fz
+
+            # Round to the nearest cube coordinate, fixing the component with the largest error
+            rx, ry, rz = round(fx), round(fy), round(fz)
+            dx, dy, dz = abs(rx - fx), abs(ry - fy), abs(rz - fz)
+            if dx > dy and dx > dz: rx = -ry - rz
+            elif dz > dy: rz = -rx - ry
+
+            coord = axial_to_oddr(rx, rz)
+            to_tile = get_tile(coord)
+            if not to_tile or not move_validator(from_tile, to_tile, is_destination=(i == steps)):
+                return None
+            path.append(coord)
+            from_tile = to_tile
+
+        return path
 
     def _Astar_search(self, start_coord, end_coord, move_validator, **kwargs):
         """Finds a single, cheapest path from start to end."""
         frontier = [(0, start_coord)]
         came_from = {start_coord: None}
         cost_so_far = {start_coord: 0}
+        get_tile = self.tile_objects.get
+        neighbor_offsets = HEX_NEIGHBOR_OFFSETS
+
+        # 🎯 The heuristic only depends on the target, so keep it until the target changes
+        if end_coord != self._h_cache_target:
+            self._h_cache = {}
+            self._h_cache_target = end_coord
+        h_cache = self._h_cache
 
         while frontier:
             _, current_coord = heapq.heappop(frontier)
             if current_coord == end_coord: break
 
-            current_tile = self.tile_objects.get(current_coord)
+            current_tile = get_tile(current_coord)
             
-            for next_coord in get_neighbors(current_coord[0], current_coord[1], self.persistent_state):
-                next_tile = self.tile_objects.get(next_coord)
+            q, r = current_coord
+            for dq, dr in neighbor_offsets[r & 1]:
+                next_coord = (q + dq, r + dr)
+                next_tile = get_tile(next_coord)
                 if not next_tile: continue
 
                 is_final_step = (next_coord == end_coord)
@@ -490,7 +670,10 @@ class MovementManager:
                 new_cost = cost_so_far[current_coord] + 1
                 if next_coord not in cost_so_far or new_cost < cost_so_far[next_coord]:
                     cost_so_far[next_coord] = new_cost
-                    priority = new_cost + axial_distance(*next_coord, *end_coord)
+                    h = h_cache.get(next_coord)
+                    if h is None:
+                        h = h_cache[next_coord] = axial_distance(*next_coord, *end_coord)
+                    priority = new_cost + h
                     heapq.heappush(frontier, (priority, next_coord))
                     came_from[next_coord] = current_coord
         
@@ -2,7 +2,7 @@
 # Contains the Player class that manages a player's state.
 
 import random
-from shared_helpers import hex_to_pixel
+from shared_helpers import hex_to_world_pixel
 
 DEBUG: True
 
@@ -60,7 +60,7 @@ class Player:
         self.q, self.r = start_coord
         
         # 🎨 Initialize a pixel position for smooth animation
-        self.pixel_pos = hex_to_pixel(self.q, self.r, persistent_state, {"var_current_zoom": 1.0, "var_render_offset": (0,0)})
+        self.pixel_pos = hex_to_world_pixel(self.q, self.r, persistent_state)
         
         # 🖌️ Create the visual token in the game's notebook
         self._create_token_drawable(notebook, assets_state, persistent_state)
@@ -2,7 +2,8 @@
 # A dedicated module to calculate the four-layer proxy elevation model.
 
 import math
-from shared_helpers import axial_distance, get_tagged_points_with_angle_dist
+from bisect import bisect_left
+from shared_helpers import oddr_to_axial, get_tagged_points_with_angle_dist
 
 # ──────────────────────────────────────────────────
 # 🎨 Config & Constants
@@ -20,11 +21,50 @@ ELEVATION_WEIGHTS = {
 # This prevents coastal land from being at 0 elevation in the continental scale
 CONTINENTAL_SCALE_MIN = 0.2
 
+# ──────────────────────────────────────────────────
+# 🧰 Helpers
+# ──────────────────────────────────────────────────
+
+def _build_distance_map(coastal_points):
+    """
+    Linearly interpolates the coast distance for each whole degree (0-359) on the
+    circular angle domain. coastal_points must already be sorted by angle.
+    """
+    angles = [p['angle'] for p in coastal_points]
+    num_points = len(coastal_points)
+
+    distance_map = [0.0] * 360
+    for i in range(360):
+        # Find the two coastal points that bracket the current angle, wrapping around
+        target_angle = float(i)
+        idx = bisect_left(angles, target_angle)
+        p2 = coastal_points[idx] if idx < num_points else coastal_points[0]
+        if idx < num_points and angles[idx] == target_angle:
+            p1 = p2
+        else:
+            p1 = coastal_points[idx - 1] if idx > 0 else coastal_points[-1]
+
+        # Calculate the angular range between the two points
+        angle_range = (p2['angle'] - p1['angle']) % 360
+
+        # Perform linear interpolation to estimate the distance for the current angle
+        if angle_range == 0:
+            distance_map[i] = p1['dist']
+        else:
+            interp_ratio = ((target_angle - p1['angle']) % 360) / angle_range
+            distance_map[i] = p1['dist'] * (1 - interp_ratio) + p2['dist'] * interp_ratio
+
+    return distance_map
+
+def _gather_land_tiles(tiledata, persistent_state):
+    """Resolves the land coordinate lookup into a flat list of tile records."""
+    return [tiledata[coord] for coord in persistent_state.get("pers_quick_tile_lookup", [])]
+
 # ──────────────────────────────────────────────────
 # ⛰️ Elevation Layer Calculators
 # ──────────────────────────────────────────────────
 
-def calculate_continental_scale(tiledata, persistent_state):
+def calculate_continental_scale(tiledata, persistent_state, land_tiles=None):
     """
     Calculates the continental scale, modeling the large, dome-like shape of a continent.
     Adds the 'continental_scale' key to land tiles in place.
@@ -46,115 +86,99 @@ def calculate_continental_scale(tiledata, persistent_state):
     # Sort coastal points by their angle to the center for ordered interpolation
     coastal_points.sort(key=lambda p: p['angle'])
 
-    # Create a dictionary to store the maximum distance for each degree
-    distance_map = {}
-    for i in range(360):
-        # Find the two coastal points that bracket the current angle
-        target_angle = float(i)
-        p1 = coastal_points[-1]
-        p2 = coastal_points[0]
-        for point in coastal_points:
-            if point['angle'] <= target_angle: p1 = point
-            if point['angle'] >= target_angle:
-                p2 = point
-                break
-
-        # Calculate the angular range between the two points
-        angle_range = (p2['angle'] - p1['angle']) % 360
+    # Build the interpolated maximum distance for each whole degree
+    distance_map = _build_distance_map(coastal_points)
 
-        # Determine the position of the target angle within that range
-        target_pos = (target_angle - p1['angle']) % 360
+    # Hoist the center's axial form, the trig functions, and the output scaling out of the loop
+    center_q, center_r = center_coord
+    center_x, center_z = oddr_to_axial(center_q, center_r)
+    atan2, degrees = math.atan2, math.degrees
+    scale_span = 1.0 - CONTINENTAL_SCALE_MIN
 
-        # Perform linear interpolation to estimate the distance for the current angle
-        if angle_range == 0:
-            distance_map[i] = p1['dist']
-        else:
-            interp_ratio = target_pos / angle_range
-            distance_map[i] = p1['dist'] * (1 - interp_ratio) + p2['dist'] * interp_ratio
-
-    # Loop through land coords
-    land_coords = persistent_state.get("pers_quick_tile_lookup", [])
-    for coord in land_coords:
-        data = tiledata[coord]
+    # Loop through land tiles
+    if land_tiles is None:
+        land_tiles = _gather_land_tiles(tiledata, persistent_state)
+    for data in land_tiles:
+        q, r = data["coord"]
 
-        # Calculate the tile's angle and distance from the map center
-        delta_q = coord[0] - center_coord[0]; delta_r = coord[1] - center_coord[1]
-        angle = math.degrees(math.atan2(-delta_r, delta_q)) % 360
-        dist_from_center = axial_distance(coord[0], coord[1], center_coord[0], center_coord[1])
+        # Calculate the tile's angle and (inlined axial) distance from the map center
+        angle = degrees(atan2(center_r - r, q - center_q)) % 360
+        dx = (q - ((r - (r & 1)) // 2)) - center_x
+        dz = r - center_z
+        dist_from_center = (abs(dx) + abs(dx + dz) + abs(dz)) // 2
         
         # Find the max distance for the tile's angle from the interpolated distance map            
-        max_dist = distance_map.get(int(angle), 1) or 1
+        max_dist = distance_map[int(angle) % 360] or 1
     
         # Calculate a raw proportional distance, capped at 1.0
         raw_proportional_dist = min(1.0, dist_from_center / max_dist)
 
-        # Invert the proportional distance so that the center of the continent is high (1.0)
-        raw_value = 1.0 - raw_proportional_dist
-
-        # Scale the raw value to fit within the predefined min/max range, preventing 0 elevation on coasts
-        data['continental_scale'] = CONTINENTAL_SCALE_MIN + (raw_value * (1.0 - CONTINENTAL_SCALE_MIN))
+        # Invert so the center of the continent is high (1.0), then scale into the
+        # predefined min/max range, preventing 0 elevation on coasts
+        data['continental_scale'] = CONTINENTAL_SCALE_MIN + ((1.0 - raw_proportional_dist) * scale_span)
 
     # Log completion for debugging
     if DEBUG:
         print(f"[elevation] ✅ Continental scale calculated.")
 
-def calculate_topographic_scale(tiledata, persistent_state):
+def calculate_topographic_scale(tiledata, persistent_state, land_tiles=None):
     """
     Calculates the topographic scale, modeling valleys and peaks relative to mountains.
     Adds the 'topographic_scale' key to land tiles in place.
     """
 
     # Isolate all land tiles to work with
-    land_tiles = [tiledata[coord] for coord in persistent_state.get("pers_quick_tile_lookup", [])]
+    if land_tiles is None:
+        land_tiles = _gather_land_tiles(tiledata, persistent_state)
     
-    # Collect all existing 'dist_to_mountain' values from the land tiles    
-    all_topo_dists = [d['dist_to_mountain'] for d in land_tiles if d.get('dist_to_mountain') is not None]
+    # Pair each land tile with its 'dist_to_mountain' in a single pass
+    topo_pairs = [(d, dist) for d in land_tiles if (dist := d.get('dist_to_mountain')) is not None]
 
     # Handle the edge case where no mountain distances are available
-    if not all_topo_dists:
+    if not topo_pairs:
         if DEBUG: print("[elevation] ⚠️ No mountain distances found; skipping topographic scale.")
         return
 
     # Find the min and max distances to normalize the range
+    _, all_topo_dists = zip(*topo_pairs)
     min_dist, max_dist = min(all_topo_dists), max(all_topo_dists)
     dist_range = max_dist - min_dist if max_dist > min_dist else 1
 
     # Normalize and apply the topographic scale to each tile
-    for data in land_tiles:
-        if data.get('dist_to_mountain') is not None:
-            # ✨ Round the final value to 4 decimal places for cleaner data.
-            value = 1.0 - ((data['dist_to_mountain'] - min_dist) / dist_range)
-            data['topographic_scale'] = round(value, 4)
+    for data, dist in topo_pairs:
+        # ✨ Round the final value to 4 decimal places for cleaner data.
+        data['topographic_scale'] = round(1.0 - ((dist - min_dist) / dist_range), 4)
 
     # Log completion for debugging
     if DEBUG:
         print(f"[elevation] ✅ Topographic scale calculated.")
 
-def calculate_coastal_scale(tiledata, persistent_state):
+def calculate_coastal_scale(tiledata, persistent_state, land_tiles=None):
     """
     Calculates the coastal scale, modeling the gradual rise of land from the sea.
     Adds the 'coastal_scale' key to land tiles in place.
     """
 
     # Isolate all land tiles to work with
-    land_tiles = [tiledata[coord] for coord in persistent_state.get("pers_quick_tile_lookup", [])]
+    if land_tiles is None:
+        land_tiles = _gather_land_tiles(tiledata, persistent_state)
     
-    # Collect all existing 'dist_from_ocean' values    
-    all_coast_dists = [d['dist_from_ocean'] for d in land_tiles if d.get('dist_from_ocean') is not None]
+    # Pair each land tile with its 'dist_from_ocean' in a single pass
+    coast_pairs = [(d, dist) for d in land_tiles if (dist := d.get('dist_from_ocean')) is not None]
 
     # Handle the edge case where no ocean distances are available
-    if not all_coast_dists:
+    if not coast_pairs:
         if DEBUG: print("[elevation] ⚠️ No ocean distances found; skipping coastal scale.")
         return
 
     # Find the min and max distances to normalize the range
+    _, all_coast_dists = zip(*coast_pairs)
     min_dist, max_dist = min(all_coast_dists), max(all_coast_dists)
     dist_range = max_dist - min_dist if max_dist > min_dist else 1
 
     # Normalize and apply the coastal scale to each tile
-    for data in land_tiles:
-        if data.get('dist_from_ocean') is not None:
-            data['coastal_scale'] = (data['dist_from_ocean'] - min_dist) / dist_range
+    for data, dist in coast_pairs:
+        data['coastal_scale'] = (dist - min_dist) / dist_range
 
     # Log completion for debugging
     if DEBUG:
@@ -173,9 +197,14 @@ def calculate_vertical_scale(tiledata, persistent_state):
         if DEBUG: print("[elevation] ⚠️ No land tiles found for vertical scale.")
         return
 
-    # Find the min and max row numbers (r-coordinates) for the landmass
-    min_r = min(r for q, r in land_coords)
-    max_r = max(r for q, r in land_coords)
+    # Find the min and max row numbers (r-coordinates) for the landmass,
+    # reusing the bounding box stored with the land lookup when available
+    land_bbox = persistent_state.get("pers_land_bbox")
+    if land_bbox:
+        _, _, min_r, max_r = land_bbox
+    else:
+        _, all_rows = zip(*land_coords)
+        min_r, max_r = min(all_rows), max(all_rows)
     range_r = max_r - min_r if max_r > min_r else 1
 
     # Apply the normalized, inverted vertical scale to each land tile
@@ -190,14 +219,15 @@ def calculate_vertical_scale(tiledata, persistent_state):
         print(f"[elevation] ✅ Vertical north-to-south scale calculated.")
 
 
-def combine_and_normalize_elevation(tiledata, persistent_state, weights):
+def combine_and_normalize_elevation(tiledata, persistent_state, weights, land_tiles=None):
     """
     Combines the three scales into a final, normalized elevation value.
     Adds the 'final_elevation' key to land tiles in place.
     """
 
     # Isolate all land tiles to work with
-    land_tiles = [tiledata[coord] for coord in persistent_state.get("pers_quick_tile_lookup", [])]
+    if land_tiles is None:
+        land_tiles = _gather_land_tiles(tiledata, persistent_state)
     
     # Calculate the total weight to use for normalization    
     total_weight = sum(weights.values()) or 1
@@ -205,16 +235,18 @@ def combine_and_normalize_elevation(tiledata, persistent_state, weights):
     # Create a new dictionary with the factors for each elevation scale
     factors = {key: value / total_weight for key, value in weights.items()}
 
-    # Initialize a dictionary to store the raw, combined elevation values
-    final_elevations = {}
-    for tile in land_tiles:
+    # Hoist the factors into locals so the per-tile sum does no factor lookups
+    f_continental, f_topographic = factors['continental'], factors['topographic']
+    f_coastal, f_vertical = factors['coastal'], factors['vertical']
 
-        # Sum the weighted values of each scale to get a raw elevation
-        final_val = (tile.get('continental_scale', 0.0) * factors['continental'] +
-                     tile.get('topographic_scale', 0.0) * factors['topographic'] +
-                     tile.get('coastal_scale', 0.0) * factors['coastal'] +
-                     tile.get('vertical_scale', 0.0) * factors['vertical'])
-        final_elevations[tile["coord"]] = final_val
+    # Sum the weighted values of each scale to get a raw elevation per tile
+    final_elevations = {
+        tile["coord"]: (tile.get('continental_scale', 0.0) * f_continental +
+                        tile.get('topographic_scale', 0.0) * f_topographic +
+                        tile.get('coastal_scale', 0.0) * f_coastal +
+                        tile.get('vertical_scale', 0.0) * f_vertical)
+        for tile in land_tiles
+    }
 
     # Handle the edge case where no elevation data was calculated
     if not final_elevations:
@@ -227,9 +259,8 @@ def combine_and_normalize_elevation(tiledata, persistent_state, weights):
 
     # Normalize each raw elevation value and store it in the tile's data
     for coord, final_val in final_elevations.items():
-        normalized_value = (final_val - min_elev) / range_elev
         # ✨ Round the final value to 4 decimal places for cleaner data.
-        tiledata[coord]['final_elevation'] = round(normalized_value, 4)
+        tiledata[coord]['final_elevation'] = round((final_val - min_elev) / range_elev, 4)
 
     # Log completion for debugging
     print(f"[elevation] ✅ Combined and stored final elevation for {len(land_tiles)} tiles.")
@@ -243,17 +274,20 @@ def run_elevation_generation(tiledata, persistent_state):
     The main orchestrator function for the elevation model.
     """
 
+    # Resolve the land tiles once and share them across every layer
+    land_tiles = _gather_land_tiles(tiledata, persistent_state)
+
     # Calculate the large-scale continental dome shape
-    calculate_continental_scale(tiledata, persistent_state)
+    calculate_continental_scale(tiledata, persistent_state, land_tiles)
 
     # Calculate the small-scale peaks and valleys relative to mountains
-    calculate_topographic_scale(tiledata, persistent_state)
+    calculate_topographic_scale(tiledata, persistent_state, land_tiles)
 
     # Calculate the gradual slope up from the coastline
-    calculate_coastal_scale(tiledata, persistent_state)
+    calculate_coastal_scale(tiledata, persistent_state, land_tiles)
 
     # Apply a north-to-south elevation bias for river flow
     calculate_vertical_scale(tiledata, persistent_state)
 
     # Combine and normalize the layers into the final elevation
-    combine_and_normalize_elevation(tiledata, persistent_state, ELEVATION_WEIGHTS)
\ No newline at end of file
+    combine_and_normalize_elevation(tiledata, persistent_state, ELEVATION_WEIGHTS, land_tiles)
\ No newline at end of file
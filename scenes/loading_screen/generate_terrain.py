@@ -86,6 +86,20 @@ REGIONAL_TAG_PRIORITY = [
     ("floodplains",),
 ]
 
+# Each terrain tag gets one bit so a priority rule can be tested with a single AND.
+TAG_BITS = {
+    tag: 1 << i
+    for i, tag in enumerate(sorted({t for rule in GLOBAL_TAG_PRIORITY + REGIONAL_TAG_PRIORITY for t in rule}))
+}
+
+def pack_tag_mask(tile):
+    """Packs a tile's truthy terrain tags into a single TAG_BITS integer."""
+    return sum(bit for tag, bit in TAG_BITS.items() if tile.get(tag))
+
+def rule_masks(priority_list):
+    """Pairs each priority rule with the TAG_BITS mask of its required tags."""
+    return [(rule, sum(TAG_BITS[t] for t in rule)) for rule in priority_list]
+
 # ──────────────────────────────────────────────────
 # 🎨 Terrain Tag-to-Sprite Recipe Book
 # ──────────────────────────────────────────────────
@@ -687,6 +701,8 @@ def fill_in_terrain_from_tags(tiledata):
     else: # Default to GLOBAL
         priority_list_to_use = GLOBAL_TAG_PRIORITY
 
+    priority_masks = rule_masks(priority_list_to_use)
+
     count = 0
     for tile in tiledata.values():
 
@@ -694,12 +710,15 @@ def fill_in_terrain_from_tags(tiledata):
         if tile.get("terrain") is not None:
             continue
 
+        # Pack the tile's tags once so each rule is a single AND
+        tile_mask = pack_tag_mask(tile)
+
         # ✍️ Find and Assign Terrain
         # Iterate through the priority list from highest to lowest priority.
-        for rule in priority_list_to_use:
+        for rule, rule_mask in priority_masks:
 
             # Check if the tile has ALL the tags required by the current rule.
-            if all(tile.get(tag) for tag in rule):
+            if (tile_mask & rule_mask) == rule_mask:
 
                 # If the tags match, get the possible terrain options for this rule.
                 options = TERRAIN_TAG_TERRAIN.get(rule)
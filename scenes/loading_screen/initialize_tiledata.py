@@ -2,7 +2,7 @@
 # Build a connected blob of N region tiles (radius R disks), then box, normalize, and oceanize.
 
 import random
-from shared_helpers import axial_distance, expand_region_seed, get_neighbors, hex_to_pixel
+from shared_helpers import axial_distance, expand_region_seed, get_neighbors
 
 # ──────────────────────────────────────────────────
 # 🎨 Config & Constants
@@ -221,11 +221,10 @@ def initialize_tiledata(persistent_state, variable_state):
     # 🗺️ Normalize World
     # ──────────────────────────────────────────────────
 
-    # Find the min/max coordinates of the entire passable area.
-    min_q = min(q for q, _ in all_passable_coords)
-    max_q = max(q for q, _ in all_passable_coords)
-    min_r = min(r for _, r in all_passable_coords)
-    max_r = max(r for _, r in all_passable_coords)
+    # Find the min/max coordinates of the entire passable area in one pass.
+    qs, rs = zip(*all_passable_coords)
+    min_q, max_q = min(qs), max(qs)
+    min_r, max_r = min(rs), max(rs)
 
     # Expand the bounds to include a padding margin around the continent.
     min_q -= min_padding
@@ -258,8 +257,15 @@ def initialize_tiledata(persistent_state, variable_state):
     width  = (max_q - min_q) + 1
     height = (max_r - min_r) + 1
 
-    # Calculate and store the final map dimensions.
-    persistent_state["pers_map_size"] = {"cols": width, "rows": height}
+    # Calculate and store the final map dimensions, plus the un-zoomed pixel
+    # extent so later consumers don't each re-derive it from the hex size.
+    tile_hex_w = persistent_state["pers_tile_hex_w"]
+    tile_hex_h = persistent_state["pers_tile_hex_h"]
+    persistent_state["pers_map_size"] = {
+        "cols": width, "rows": height,
+        "pixel_w_1x": (width + 0.5) * tile_hex_w,
+        "pixel_h_1x": (height * 0.75 + 0.25) * tile_hex_h,
+    }
 
     # ──────────────────────────────────────────────────
     # 💾 Save Tiledata
@@ -375,19 +381,25 @@ def build_hex_pixel_grid(tiledata, persistent_state):
     un-offsetted world pixel centers for fast lookups.
     """
     print("[helpers] ✅ Building hex pixel grid for fast lookups...")
-    pixel_grid = {}
-    
-    # Create a temporary variable_state for the calculation, assuming no zoom or offset
-    temp_variable_state = {
-        "var_current_zoom": 1.0,
-        "var_render_offset": (0, 0)
-    }
 
+    # 📐 Inline hex_to_pixel's affine transform at zoom 1.0 with no offset,
+    # so the loop is pure arithmetic instead of a call + dict lookups per tile.
+    horiz_spacing = persistent_state["pers_tile_hex_w"]
+    vert_spacing  = persistent_state["pers_tile_hex_h"] * 0.75
+    half_spacing  = horiz_spacing / 2
+
+    pixel_grid = {}
     for coord, tile in tiledata.items():
-        # We use hex_to_pixel from shared_helpers to get the center point
-        px, py = hex_to_pixel(tile["coord"][0], tile["coord"][1], persistent_state, temp_variable_state)
-        pixel_grid[coord] = (px, py)
-        
+        q, r = tile["coord"]
+        row_indent = half_spacing if int(r) % 2 != 0 else 0
+        pixel_grid[coord] = (q * horiz_spacing + row_indent, r * vert_spacing)
+
+    # 📏 Store the grid's real coordinate bounds; normalization keeps row parity,
+    # so rows can start at 1 rather than 0.
+    if pixel_grid:
+        qs, rs = zip(*pixel_grid)
+        persistent_state["pers_hex_grid_bounds"] = (min(qs), max(qs), min(rs), max(rs))
+
     return pixel_grid
 
 # ──────────────────────────────────────────────────
@@ -410,15 +422,22 @@ def calculate_and_store_map_center(tiledata, persistent_state):
         persistent_state["pers_map_center"] = None
         persistent_state["pers_land_count"] = 0
         persistent_state["pers_quick_tile_lookup"] = [] # Ensure lookup is an empty list
+        persistent_state["pers_land_bbox"] = None
         return
 
     # Save the core data to the persistent state dictionary.
     persistent_state["pers_land_count"] = len(land_coords)
     persistent_state["pers_quick_tile_lookup"] = land_coords
 
+    # Split the land coordinates into columns once for the sums and the bounding box.
+    land_qs, land_rs = zip(*land_coords)
+
+    # Save the land's axial bounding box (min_q, max_q, min_r, max_r) so later passes skip the rescan.
+    persistent_state["pers_land_bbox"] = (min(land_qs), max(land_qs), min(land_rs), max(land_rs))
+
     # Calculate the center of mass for the land tiles.
-    sum_q = sum(q for q, r in land_coords)
-    sum_r = sum(r for q, r in land_coords)
+    sum_q = sum(land_qs)
+    sum_r = sum(land_rs)
     
     avg_q = sum_q / len(land_coords)
     avg_r = sum_r / len(land_coords)
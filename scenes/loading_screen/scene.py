@@ -235,25 +235,33 @@ class LoadingScene:
     
     def handle_events(self, events, mouse_pos): pass
 
+# Exact value types that serialize to JSON without a custom encoder, checked with one hash lookup.
+_JSON_TYPES = frozenset((int, float, str, list, dict, bool, type(None)))
+
 def export_tiledata_json(tiledata):
-    """Saves the complete, final tiledata to a JSON file."""
+    """Saves the complete, final tiledata to a JSON file, one tile per line."""
     
     try:
-        # 🏞️ Clean the data for JSON serialization.
-        cleaned = {
-            f"{q},{r}": {
-                # 1. Round floats to 3 decimal points, leave other types as is.
-                k: round(v, 3) if isinstance(v, float) else v
-                for k, v in tile.items()
-                # 2. Exclude the 'type' key and any non-standard JSON types.
-                if k != 'type' and isinstance(v, (int, float, str, list, dict, bool, type(None)))
-            }
-            for (q, r), tile in tiledata.items()
-        }
-
-        # 💾 Open the file and dump the cleaned data.
-        with open("tiledata_export.json", "w") as f:
-            json.dump(cleaned, f, indent=2)
+        # 💾 Stream each cleaned tile straight to disk instead of building the whole map first.
+        # Compact per-tile dumps also stay on json's C encoder, which indent= disables.
+        # A 64 KiB write buffer batches the many small per-tile writes into few syscalls.
+        dumps = json.JSONEncoder(separators=(",", ":")).encode
+        with open("tiledata_export.json", "w", encoding="utf-8", buffering=1 << 16) as f:
+            f.write("{")
+            separator = "\n"
+            for (q, r), tile in tiledata.items():
+
+                # 🏞️ Clean the tile for JSON serialization.
+                cleaned = {
+                    # 1. Round floats to 3 decimal points, leave other types as is.
+                    k: round(v, 3) if type(v) is float else v
+                    for k, v in tile.items()
+                    # 2. Exclude the 'type' key and any non-standard JSON types.
+                    if k != 'type' and type(v) in _JSON_TYPES
+                }
+                f.write(f'{separator}  "{q},{r}": {dumps(cleaned)}')
+                separator = ",\n"
+            f.write("\n}\n")
         print(f"[exports] ✅ Saved tiledata.json.")
     except Exception as e:
         print(f"[exports] ❌ ERROR: Failed to save tiledata.json: {e}")
\ No newline at end of file
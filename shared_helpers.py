@@ -2,7 +2,6 @@
 # Includes various helper modules shared by various scripts
 
 import math
-import pygame
 
 DEBUG = True
 
@@ -99,11 +98,14 @@ def axial_distance(aq, ar, bq, br):
 # 🧭 Grid Topology & Neighbors
 # ──────────────────────────────────────────────
 
+# Odd-r neighbor offsets indexed by row parity (r & 1), in pers_neighbor_order (NW, NE, E, SE, SW, W)
+HEX_NEIGHBOR_OFFSETS = (
+    ((-1, -1), ( 0, -1), (+1,  0), ( 0, +1), (-1, +1), (-1,  0)),  # even rows
+    (( 0, -1), (+1, -1), (+1,  0), (+1, +1), ( 0, +1), (-1,  0)),  # odd rows
+)
+
 def get_neighbors(q, r, persistent_state):
-    oddr = persistent_state["pers_neighbor_offsets"]["oddr"]
-    parity = "odd" if (r & 1) else "even"
-    dir_map = oddr[parity]
-    return [(q + dq, r + dr) for d in persistent_state["pers_neighbor_order"] for dq, dr in [dir_map[d]]]
+    return [(q + dq, r + dr) for dq, dr in HEX_NEIGHBOR_OFFSETS[r & 1]]
 
 def get_neighbor_in_direction(q, r, direction_name, persistent_state):
     oddr = persistent_state["pers_neighbor_offsets"]["oddr"]
@@ -222,24 +224,36 @@ def hex_to_pixel(q, r, persistent_state, variable_state):
     offset_x, offset_y = variable_state.get("var_render_offset", (0, 0))
     return (x + offset_x, y + offset_y)
 
+# Camera state for un-zoomed, un-offset world space. Shared, so treat it as read-only.
+WORLD_SPACE_STATE = {"var_current_zoom": 1.0, "var_render_offset": (0, 0)}
+
+def hex_to_world_pixel(q, r, persistent_state):
+    """hex_to_pixel at zoom 1.0 with no offset, without building a temporary camera state."""
+    horiz_spacing = persistent_state["pers_tile_hex_w"]
+    row_indent = horiz_spacing / 2 if int(r) % 2 != 0 else 0
+    return (q * horiz_spacing + row_indent, r * persistent_state["pers_tile_hex_h"] * 0.75)
+
 def hex_geometry(q, r, persistent_state, variable_state):
     anatomy = persistent_state["pers_hex_anatomy"]
     zoom = variable_state.get("var_current_zoom", 1.0)
     cx, cy = hex_to_pixel(q, r, persistent_state, variable_state)
     half_w = (persistent_state["pers_tile_hex_w"] * zoom) / 2
     half_h = (persistent_state["pers_tile_hex_h"] * zoom) / 2
-    corners = {}
-    for idx, info in anatomy["corners"].items():
-        vx, vy = info["vector"]
-        corners[idx] = (cx + vx * half_w, cy + vy * half_h)
+    corners = {
+        idx: (cx + info["vector"][0] * half_w, cy + info["vector"][1] * half_h)
+        for idx, info in anatomy["corners"].items()
+    }
+
+    # Resolve the row's neighbor offsets once instead of per edge
+    dir_map = persistent_state["pers_neighbor_offsets"]["oddr"]["odd" if (r & 1) else "even"]
+    edge_to_neighbor = persistent_state["pers_edge_to_neighbor"]
     edges = {}
+    neighbors = {}
     for idx, info in anatomy["edges"].items():
         a, b = info["corner_pair"]
         edges[idx] = (corners[a], corners[b])
-    neighbors = {}
-    for idx, info in anatomy["edges"].items():
-        edge_name = info["name"]
-        neighbors[edge_name] = edge_neighbor(q, r, edge_name, persistent_state)
+        dq, dr = dir_map[edge_to_neighbor[info["name"]]]
+        neighbors[info["name"]] = (q + dq, r + dr)
     return {
         "center": (cx, cy), "corners": corners,
         "edges": edges, "neighbors": neighbors
@@ -247,8 +261,9 @@ def hex_geometry(q, r, persistent_state, variable_state):
 
 def pixel_to_hex(mouse_pos, persistent_state, variable_state):
     """
-    Finds the hex coordinate closest to the given mouse position by checking
-    against a pre-calculated grid of hex centers.
+    Finds the hex coordinate closest to the given mouse position. The hex_to_pixel
+    transform is inverted to a row/column estimate so only a few neighboring
+    centers are checked; the full pre-calculated grid is scanned as a fallback.
     """
     # Get camera state from the variable_state dictionary
     camera_offset = variable_state.get("var_render_offset", (0, 0))
@@ -265,6 +280,31 @@ def pixel_to_hex(mouse_pos, persistent_state, variable_state):
     closest_coord = None
     min_dist_sq = float('inf')
 
+    # 📐 Estimate the row, then take the nearest column in it and its two neighboring rows.
+    # Rows further away share a parity with one of these and are strictly further in y.
+    # The bounds are the grid's actual coord range, which need not start at row 0.
+    grid_bounds = persistent_state.get("pers_hex_grid_bounds")
+    if grid_bounds:
+        min_q, max_q, min_r, max_r = grid_bounds
+        horiz_spacing = persistent_state["pers_tile_hex_w"]
+        vert_spacing = persistent_state["pers_tile_hex_h"] * 0.75
+        row_guess = min(max(round(unzoomed_y / vert_spacing), min_r), max_r)
+
+        for r in (row_guess - 1, row_guess, row_guess + 1):
+            if not min_r <= r <= max_r: continue
+            row_indent = horiz_spacing / 2 if r % 2 != 0 else 0
+            q = min(max(round((unzoomed_x - row_indent) / horiz_spacing), min_q), max_q)
+            center_pos = pixel_grid.get((q, r))
+            if center_pos is None: continue
+
+            dist_sq = (unzoomed_x - center_pos[0])**2 + (unzoomed_y - center_pos[1])**2
+            if dist_sq < min_dist_sq:
+                min_dist_sq = dist_sq
+                closest_coord = (q, r)
+
+        if closest_coord is not None:
+            return closest_coord
+
     # Find the hex center with the smallest squared distance to the mouse
     for coord, center_pos in pixel_grid.items():
         dist_sq = (unzoomed_x - center_pos[0])**2 + (unzoomed_y - center_pos[1])**2
@@ -449,6 +489,9 @@ def desaturate_surface(surf, factor):
     if factor <= 0.0: return surf
     if factor > 1.0: factor = 1.0
 
+    # pygame is imported here so headless world generation can use these helpers without it
+    import pygame
+
     # 2. Create a grayscale version of the sprite.
     #    This uses the standard formula for luminance to preserve brightness.
     grayscale_surf = surf.copy()
@@ -478,5 +521,6 @@ def desaturate_surface(surf, factor):
 
 # [ ] TODO: run every single PNG with transperancy through this when loading it
 def load_png(path, with_alpha=True):
+    import pygame
     surf = pygame.image.load(path)
     return surf.convert_alpha() if with_alpha else surf.convert()
\ No newline at end of file
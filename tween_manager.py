@@ -2,7 +2,7 @@
 # A flexible animation system using an orchestrator and composable "puzzle pieces".
 
 import math
-from shared_helpers import hex_to_pixel, hex_geometry, get_point_on_bezier_curve
+from shared_helpers import hex_to_world_pixel, hex_geometry, get_point_on_bezier_curve, WORLD_SPACE_STATE
 
 # ──────────────────────────────────────────────────
 # 🎨 Config & Constants
@@ -238,12 +238,10 @@ class PlayerTokenUpdater:
         self.previous_segment_r = 0
 
     def get_world_pixel(self, q, r):
-        temp_state = {"var_current_zoom": 1.0, "var_render_offset": (0, 0)}
-        return hex_to_pixel(q, r, self.persistent_state, temp_state)
+        return hex_to_world_pixel(q, r, self.persistent_state)
     
     def get_hex_geom(self, q, r):
-        temp_state = {"var_current_zoom": 1.0, "var_render_offset": (0, 0)}
-        return hex_geometry(q, r, self.persistent_state, temp_state)
+        return hex_geometry(q, r, self.persistent_state, WORLD_SPACE_STATE)
 
     def get_edge_center(self, geom, adjacent_coord):
         try: